@@ -162,8 +162,10 @@ def start_gateway(debug=False):
                     # dashboard subprocess) can display health state.
                     health_probe.save_snapshot()
 
-                # Interruptible sleep — wakes immediately on SIGTERM
-                _stop_event.wait(1)
+                # Interruptible sleep — wakes immediately on SIGTERM.  The
+                # probe's verdict can only change once per probe cycle, so
+                # there is nothing new to read between cycles.
+                _stop_event.wait(HEALTH_CHECK_INTERVAL)
             else:
                 # Connection is down — attempt reconnect with backoff
                 if not strategy.should_retry():
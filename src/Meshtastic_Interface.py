@@ -348,8 +348,9 @@ class MeshtasticInterface(Interface):
         to the RNS transport layer via owner.inbound().
         """
         try:
-            if 'decoded' in packet and 'payload' in packet['decoded']:
-                payload = packet['decoded']['payload']
+            decoded = packet.get('decoded')
+            payload = decoded.get('payload') if decoded is not None else None
+            if payload is not None:
                 self.rxb += len(payload)
                 self.rx_packets += 1
                 if self._bridge_health:
@@ -1,6 +1,5 @@
 import logging
 import os
-import platform
 import sys
 import threading
 import time
@@ -20,6 +19,7 @@ from src.utils.log import setup_logging
 from src.utils.service_check import (
     check_rns_lib, check_meshtastic_lib, check_serial_ports,
     check_rnsd_status, check_meshtasticd_status, check_rns_udp_port,
+    get_platform_info, run_all_checks,
 )
 
 log = logging.getLogger("dashboard")
@@ -142,19 +142,28 @@ def home():
     cfg = load_config()
     gw = cfg.get('gateway', {})
 
-    rns_ok, rns_ver = check_rns_lib()
-    mesh_ok, mesh_ver = check_meshtastic_lib()
-    serial_ports = check_serial_ports()
-    rnsd_ok, rnsd_info = check_rnsd_status()
-    meshd_ok, meshd_info = check_meshtasticd_status()
-    udp_ok, udp_info = check_rns_udp_port()
+    results = run_all_checks({
+        "rns_lib": check_rns_lib,
+        "meshtastic_lib": check_meshtastic_lib,
+        "serial_ports": check_serial_ports,
+        "rnsd": check_rnsd_status,
+        "meshtasticd": check_meshtasticd_status,
+        "rns_udp": check_rns_udp_port,
+    })
+    rns_ok, rns_ver = results["rns_lib"]
+    mesh_ok, mesh_ver = results["meshtastic_lib"]
+    serial_ports = results["serial_ports"]
+    rnsd_ok, rnsd_info = results["rnsd"]
+    meshd_ok, meshd_info = results["meshtasticd"]
+    udp_ok, udp_info = results["rns_udp"]
+    host = get_platform_info()
 
     return render_template(
         'dashboard.html',
         version=__version__,
-        system_platform=f"{platform.system()} {platform.release()}",
-        hostname=platform.node(),
-        python_version=platform.python_version(),
+        system_platform=f"{host['system']} {host['release']}",
+        hostname=host['hostname'],
+        python_version=host['python'],
         rns_ok=rns_ok,
         rns_ver=rns_ver,
         mesh_ok=mesh_ok,
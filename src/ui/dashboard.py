@@ -6,7 +6,7 @@ directly in the terminal.  No external dependencies (no Flask, no curses).
 Invoked from the Command Center menu (option 'd').
 """
 import os
-import platform
+import re
 import shutil
 import sys
 
@@ -20,52 +20,49 @@ from src.ui.widgets import (
     box_top, box_mid, box_bot, box_row, box_section, box_kv,
 )
 from src.utils.common import CONFIG_PATH, RNS_CONFIG_DIR, load_config
-from src.utils.service_check import (
-    check_rns_lib, check_meshtastic_lib, check_serial_ports, check_rns_config,
-    check_rnsd_status, check_meshtasticd_status, check_rns_udp_port,
-)
+from src.utils.service_check import get_platform_info, run_all_checks
 
 
 # ── System Resource Helpers (stdlib only, MeshForge pattern) ──
+_MEMINFO_RE = re.compile(rb'^(MemTotal|MemAvailable):\s+(\d+)', re.MULTILINE)
+
+
 def _get_uptime():
     """Return system uptime string, or None if unavailable."""
+    # No isfile() pre-check: a missing /proc is just an OSError from open()
     try:
-        if os.path.isfile('/proc/uptime'):
-            with open('/proc/uptime') as f:
-                secs = int(float(f.read().split()[0]))
-            days, rem = divmod(secs, 86400)
-            hours, rem = divmod(rem, 3600)
-            mins = rem // 60
-            parts = []
-            if days:
-                parts.append(f"{days}d")
-            if hours:
-                parts.append(f"{hours}h")
-            parts.append(f"{mins}m")
-            return " ".join(parts)
-    except (OSError, ValueError):
-        pass
-    return None
+        with open('/proc/uptime') as f:
+            secs = int(float(f.read().split()[0]))
+    except (OSError, ValueError, IndexError):
+        return None
+    days, rem = divmod(secs, 86400)
+    hours, rem = divmod(rem, 3600)
+    mins = rem // 60
+    parts = []
+    if days:
+        parts.append(f"{days}d")
+    if hours:
+        parts.append(f"{hours}h")
+    parts.append(f"{mins}m")
+    return " ".join(parts)
 
 
 def _get_memory():
     """Return (used_mb, total_mb) from /proc/meminfo, or None."""
     try:
-        if os.path.isfile('/proc/meminfo'):
-            info = {}
-            with open('/proc/meminfo') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        info[parts[0].rstrip(':')] = int(parts[1])
-            total = info.get('MemTotal', 0)
-            avail = info.get('MemAvailable', 0)
-            if total > 0:
-                used_mb = (total - avail) / 1024
-                total_mb = total / 1024
-                return (used_mb, total_mb)
-    except (OSError, ValueError, KeyError):
-        pass
+        with open('/proc/meminfo', 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Pull the two fields straight out of the raw bytes instead of
+    # decoding and splitting all ~50 lines into a dict.
+    info = {key: int(val) for key, val in _MEMINFO_RE.findall(data)}
+    total = info.get(b'MemTotal', 0)
+    avail = info.get(b'MemAvailable', 0)
+    if total > 0:
+        used_mb = (total - avail) / 1024
+        total_mb = total / 1024
+        return (used_mb, total_mb)
     return None
 
 
@@ -82,6 +79,9 @@ def _get_disk():
 
 # ── Render ───────────────────────────────────────────────────
 def render_dashboard():
+    # Probe before clearing so a slow systemctl doesn't leave a blank screen
+    checks = run_all_checks()
+
     sys.stdout.write('\033[H\033[2J\033[3J')
     sys.stdout.flush()
 
@@ -103,9 +103,10 @@ def render_dashboard():
     # ── System Panel ──
     print(box_top(w))
     print(box_section("SYSTEM", w))
-    print(box_kv("Platform", f"{platform.system()} {platform.release()}", w))
-    print(box_kv("Python", f"{platform.python_version()} ({sys.executable})", w))
-    print(box_kv("Hostname", platform.node(), w))
+    host = get_platform_info()
+    print(box_kv("Platform", f"{host['system']} {host['release']}", w))
+    print(box_kv("Python", f"{host['python']} ({sys.executable})", w))
+    print(box_kv("Hostname", host['hostname'], w))
 
     uptime = _get_uptime()
     if uptime:
@@ -129,8 +130,8 @@ def render_dashboard():
     print()
 
     # ── Libraries Panel ──
-    rns_ok, rns_ver = check_rns_lib()
-    mesh_ok, mesh_ver = check_meshtastic_lib()
+    rns_ok, rns_ver = checks["rns_lib"]
+    mesh_ok, mesh_ver = checks["meshtastic_lib"]
     print(box_top(w))
     print(box_section("LIBRARIES", w))
 
@@ -140,15 +141,15 @@ def render_dashboard():
     print(box_kv("Meshtastic", mesh_status, w))
 
     # Serial ports
-    ports = check_serial_ports()
+    ports = checks["serial_ports"]
     print(box_kv("Serial Ports", ", ".join(ports), w))
     print(box_bot(w))
     print()
 
     # ── Services Panel ──
-    rnsd_ok, rnsd_info = check_rnsd_status()
-    meshd_ok, meshd_info = check_meshtasticd_status()
-    udp_ok, udp_info = check_rns_udp_port()
+    rnsd_ok, rnsd_info = checks["rnsd"]
+    meshd_ok, meshd_info = checks["meshtasticd"]
+    udp_ok, udp_info = checks["rns_udp"]
     print(box_top(w))
     print(box_section("SERVICES", w))
     rnsd_status = f"{C.GRN}RUNNING{C.RST}  {rnsd_info}" if rnsd_ok else f"{C.YLW}STOPPED{C.RST}  {rnsd_info}"
@@ -161,7 +162,7 @@ def render_dashboard():
     print()
 
     # ── RNS Config Panel ──
-    rns_found, rns_info = check_rns_config()
+    rns_found, rns_info = checks["rns_config"]
     print(box_top(w))
     print(box_section("RETICULUM", w))
     if rns_found:
@@ -259,14 +260,14 @@ def render_dashboard():
     try:
         from src.utils.node_tracker import NodeTracker
         tracker = NodeTracker()
-        nodes = tracker.get_all_nodes()
+        nodes = tracker.get_all_nodes(limit=5)
         print(box_top(w))
         print(box_section("KNOWN NODES", w))
-        print(box_kv("Total Nodes", str(len(nodes)), w))
+        print(box_kv("Total Nodes", str(tracker.node_count), w))
         if nodes:
             import time as _time
             print(box_mid(w))
-            for node in nodes[:5]:
+            for node in nodes:
                 name = node.get("node_name") or node.get("node_id", "?")
                 ago = _time.time() - node.get("last_seen", 0)
                 if ago < 60:
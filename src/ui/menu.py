@@ -1,11 +1,11 @@
 import argparse
+import functools
 import logging
 import os
 import subprocess
 import shutil
 import sys
 import time
-import webbrowser
 
 # Ensure project root is on path for imports
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,7 +19,9 @@ from src.ui.widgets import (
 )
 from src.utils.common import CONFIG_PATH, NOMAD_CONFIG, RNS_CONFIG_FILE, load_config, validate_port
 from src.utils.log import setup_logging, default_log_path, install_crash_handler
-from src.utils.service_check import check_rnsd_status, check_meshtasticd_status
+from src.utils.service_check import (
+    check_rnsd_status, check_meshtasticd_status, clear_probe_cache,
+)
 from src.utils.timeouts import STATUS_CACHE_TTL
 
 log = logging.getLogger("menu")
@@ -48,7 +50,12 @@ class _StatusCache:
         return result
 
     def invalidate(self, key=None):
-        """Clear one key or the entire cache."""
+        """Clear one key or the entire cache.
+
+        Also drops service_check's short-lived probe memo so the next
+        read reflects a service that was just started or stopped.
+        """
+        clear_probe_cache()
         if key:
             self._cache.pop(key, None)
         else:
@@ -82,20 +89,49 @@ def _flush_input():
         pass  # Windows, piped stdin, or not a TTY — safe to skip
 
 
+_CLEAR_SEQ = '\033[H\033[2J\033[3J'
+
+
+def _enable_vt_mode():
+    """Turn on ANSI escape processing for the Windows console.
+
+    Windows 10+ consoles understand VT sequences once
+    ENABLE_VIRTUAL_TERMINAL_PROCESSING is set on stdout.  Returns False
+    on older consoles, redirected output, or non-Windows hosts.
+    """
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
+# Probed once at import; when VT works, clearing no longer spawns cmd.exe.
+_NT_USE_VT = os.name == 'nt' and _enable_vt_mode()
+
+
 def clear_screen():
     """Clear terminal without shell invocation."""
-    if os.name == 'nt':
+    if os.name == 'nt' and not _NT_USE_VT:
         subprocess.run(['cmd', '/c', 'cls'], shell=False, timeout=5)
     else:
-        sys.stdout.write('\033[H\033[2J\033[3J')
+        sys.stdout.write(_CLEAR_SEQ)
         sys.stdout.flush()
 
 
+@functools.lru_cache(maxsize=1)
 def get_editor():
     """Detect a text editor available on this platform.
 
     Validates $EDITOR/$VISUAL with shutil.which() to prevent command
     injection via malicious environment variables (MeshForge pattern).
+    The PATH walk runs once per menu session; the result is memoized.
     """
     env_editor = os.environ.get('EDITOR') or os.environ.get('VISUAL')
     if env_editor and shutil.which(env_editor):
@@ -294,6 +330,9 @@ def main_menu():
                 dash_port = cfg.get('dashboard', {}).get('port', 5000)
                 ok, err = validate_port(dash_port) if isinstance(dash_port, int) else (False, "not an integer")
                 if ok:
+                    # Deferred: webbrowser pulls in shlex/subprocess/threading
+                    # machinery the menu's cold start never needs.
+                    import webbrowser
                     try:
                         webbrowser.open(f"http://localhost:{dash_port}")
                     except OSError as e:
@@ -27,14 +27,16 @@ Usage:
     if health.get_bridge_status() == BridgeStatus.DEGRADED:
         print("Warning:", health.get_degraded_reason())
 """
+import itertools
 import logging
+import re
 import threading
 import time
 import uuid
 from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 log = logging.getLogger("bridge_health")
 
@@ -92,6 +94,13 @@ TRANSIENT_ERROR_PATTERNS = [
     "resource temporarily unavailable",
 ]
 
+# One alternation per category, compiled once: a single scan of the
+# message replaces a substring test per pattern (and the .lower() copy).
+_PERMANENT_RE = re.compile(
+    "|".join(map(re.escape, PERMANENT_ERROR_PATTERNS)), re.IGNORECASE)
+_TRANSIENT_RE = re.compile(
+    "|".join(map(re.escape, TRANSIENT_ERROR_PATTERNS)), re.IGNORECASE)
+
 
 def classify_error(error: Exception) -> str:
     """Classify an error as transient or permanent.
@@ -102,18 +111,17 @@ def classify_error(error: Exception) -> str:
     Returns:
         "transient", "permanent", or "unknown".
     """
-    msg = str(error).lower()
+    msg = str(error)
 
-    for pattern in PERMANENT_ERROR_PATTERNS:
-        if pattern in msg:
-            return "permanent"
+    if _PERMANENT_RE.search(msg):
+        return "permanent"
 
-    for pattern in TRANSIENT_ERROR_PATTERNS:
-        if pattern in msg:
-            return "transient"
+    if _TRANSIENT_RE.search(msg):
+        return "transient"
 
-    if isinstance(error, (ConnectionError, BrokenPipeError,
-                          ConnectionResetError, TimeoutError, OSError)):
+    # ConnectionError, BrokenPipeError, TimeoutError, ... all derive
+    # from OSError, so one isinstance covers the whole family.
+    if isinstance(error, OSError):
         return "transient"
 
     return "unknown"
@@ -199,25 +207,48 @@ class BridgeHealthMonitor:
         """
         now = time.time()
         with self._lock:
-            self._connection_events.append(
-                ConnectionEvent(timestamp=now, service=service,
-                                event=event, detail=detail)
-            )
+            self._apply_connection_event(now, service, event, detail)
+
+    def record_events_bulk(self, events: Iterable[Tuple[str, ...]]) -> None:
+        """Record several connection events under one lock acquisition.
 
-            if event == "connected":
-                if not self._connected.get(service, False):
-                    self._connected[service] = True
-                    self._last_connected[service] = now
-                    self._connection_count[service] = (
-                        self._connection_count.get(service, 0) + 1
-                    )
-            elif event in ("disconnected", "error"):
-                if self._connected.get(service, False):
-                    connected_at = self._last_connected.get(service, now)
-                    svc_uptime = self._uptime_seconds.get(service, 0.0)
-                    self._uptime_seconds[service] = svc_uptime + (now - connected_at)
-                self._connected[service] = False
-                self._last_disconnected[service] = now
+        Meant for replaying a known sequence (e.g. bringing both links
+        up at startup).  Events are applied in order with a shared
+        timestamp, exactly as repeated ``record_connection_event()``
+        calls would apply them.
+
+        Args:
+            events: ``(service, event)`` or ``(service, event, detail)``
+                    tuples.
+        """
+        now = time.time()
+        with self._lock:
+            for ev in events:
+                self._apply_connection_event(now, *ev)
+
+    def _apply_connection_event(
+        self, now: float, service: str, event: str, detail: str = "",
+    ) -> None:
+        """Update connection state for one event.  Caller holds the lock."""
+        self._connection_events.append(
+            ConnectionEvent(timestamp=now, service=service,
+                            event=event, detail=detail)
+        )
+
+        if event == "connected":
+            if not self._connected.get(service, False):
+                self._connected[service] = True
+                self._last_connected[service] = now
+                self._connection_count[service] = (
+                    self._connection_count.get(service, 0) + 1
+                )
+        elif event in ("disconnected", "error"):
+            if self._connected.get(service, False):
+                connected_at = self._last_connected.get(service, now)
+                svc_uptime = self._uptime_seconds.get(service, 0.0)
+                self._uptime_seconds[service] = svc_uptime + (now - connected_at)
+            self._connected[service] = False
+            self._last_disconnected[service] = now
 
     # ── Message Tracking ─────────────────────────────────────
     def record_message_sent(self, direction: str) -> None:
@@ -233,6 +264,26 @@ class BridgeHealthMonitor:
             )
             self._message_timestamps.append(now)
 
+    def record_message_sent_bulk(self, direction: str, n: int) -> None:
+        """Record *n* messages bridged at once (e.g. a flushed queue).
+
+        One lock acquisition and one counter update for the whole batch;
+        the rate window still holds one timestamp per message so
+        ``get_message_rate()`` and the window size are unaffected.
+
+        Args:
+            direction: "mesh_to_rns" or "rns_to_mesh".
+            n:         Number of messages sent.
+        """
+        if n <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._messages_sent[direction] = (
+                self._messages_sent.get(direction, 0) + n
+            )
+            self._message_timestamps.extend(itertools.repeat(now, n))
+
     def record_message_failed(
         self, direction: str, requeued: bool = False,
     ) -> None:
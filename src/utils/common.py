@@ -47,6 +47,9 @@ _VALID_BRIDGE_MODES = ("direct", "mqtt")
 
 _HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9._:\-]+$')
 
+# Config defaults; all pass the checks below, so skip straight to OK.
+_COMMON_HOSTS = frozenset(("localhost", "127.0.0.1", "::1", "0.0.0.0"))
+
 
 @dataclass
 class ConfigValidationError:
@@ -76,6 +79,8 @@ def validate_hostname(host):
     """
     if not host or not isinstance(host, str):
         return False, "hostname must be a non-empty string"
+    if host in _COMMON_HOSTS:
+        return True, ""
     # Reject null bytes and newlines (injection prevention)
     if '\x00' in host or '\n' in host or '\r' in host:
         return False, "hostname contains null bytes or newlines"
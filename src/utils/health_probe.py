@@ -453,18 +453,30 @@ class ActiveHealthProbe:
                     pass
 
     def check_systemd_service(self, service_name: str) -> HealthResult:
-        """Check if a systemd service is active."""
+        """Check if a systemd service is active.
+
+        Reads stdout as raw bytes with stderr discarded — ``is-active``
+        answers with a single word, so there is no need for a second
+        pipe or a locale decode on every probe.
+        """
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 ["systemctl", "is-active", service_name],
-                capture_output=True, text=True, timeout=SUBPROCESS_QUICK,
-            )
-            status = result.stdout.strip()
-            if status == "active":
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            ) as proc:
+                try:
+                    out, _ = proc.communicate(timeout=SUBPROCESS_QUICK)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    return HealthResult(healthy=False, reason="timeout")
+            status = out.strip()
+            if status == b"active":
                 return HealthResult(healthy=True, reason="active")
-            return HealthResult(healthy=False, reason="status_%s" % status)
-        except subprocess.TimeoutExpired:
-            return HealthResult(healthy=False, reason="timeout")
+            return HealthResult(
+                healthy=False,
+                reason="status_%s" % status.decode("ascii", "replace"),
+            )
         except FileNotFoundError:
             return HealthResult(healthy=False, reason="systemctl_not_found")
         except Exception as exc:
@@ -7,16 +7,143 @@ a descriptive name.
 
 Includes an optional JSON structured formatter (MeshForge pattern) for
 machine-parseable log aggregation.
+
+Handlers that touch the terminal or disk are owned by a QueueListener
+thread; callers only pay for an in-memory enqueue, so a slow SD card or
+a stalled console cannot block the TX/RX path.
 """
-import json
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import os
+import queue
+import stat
 import sys
+import threading
 import time
 import traceback
+from json.encoder import encode_basestring_ascii as _json_str
+
+from src.utils.timeouts import LOG_FLUSH_INTERVAL
 
 _configured = False
+_listener = None
+
+# Userspace buffer for the log file; INFO/DEBUG lines accumulate here
+# instead of costing one write() syscall each.
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Attribute stamped on handlers installed by setup_logging().  The
+# _configured flag is per-module-object, so if this file is ever imported
+# under two names (``src.utils.log`` and ``utils.log``) each copy would
+# install its own handlers and every record would be written twice.
+# Checking the root logger for tagged handlers makes setup idempotent
+# per process rather than per import.
+_HANDLER_TAG = "_rns_gateway"
+
+
+def _has_tagged_handler(logger, kind):
+    """Return True if *logger* already carries a gateway handler of *kind*."""
+    return any(getattr(h, _HANDLER_TAG, None) == kind for h in logger.handlers)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process listener.
+
+    The stock ``prepare()`` pre-formats the record and strips
+    ``exc_info`` so it can be pickled across processes.  Our queue never
+    leaves the process, so only the message/args merge is done here (in
+    the caller's thread, before mutable args can change) and the
+    downstream formatter still sees the structured exception.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that batches writes in a 64 KiB buffer.
+
+    The stock handler flushes after every record, and its rollover check
+    seeks to EOF (which also flushes) — one or two syscalls per line.
+    Here records below WARNING stay buffered and a background thread
+    flushes every ``LOG_FLUSH_INTERVAL`` seconds so a quiet log still
+    reaches disk.  WARNING and above are flushed immediately so crash
+    context is never stuck in memory.
+
+    The rollover check uses an in-process byte count: each buffered
+    record adds its encoded length, and every real flush re-reads the
+    size with ``fstat``.  The menu, launcher and daemon all append to the
+    same file, so the resync picks up their writes too.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._pending = 0
+        self._regular = True
+        self._defer_flush = False
+        super().__init__(*args, **kwargs)
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="log-flush", daemon=True,
+        )
+        self._flusher.start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding,
+                      errors=self.errors, buffering=LOG_BUFFER_SIZE)
+        self._sync_size(stream)
+        return stream
+
+    def _sync_size(self, stream):
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # bpo-45401: never roll over anything but a regular file (e.g. /dev/null)
+        self._regular = stat.S_ISREG(st.st_mode)
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular:
+            return False
+        line = self.format(record) + self.terminator
+        self._pending = len(line.encode(self.encoding or "utf-8", errors="replace"))
+        return self._size + self._pending >= self.maxBytes
+
+    def emit(self, record):
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self):
+        # StreamHandler.emit() calls flush() right after writing each
+        # record: a deferred record is only counted, anything else is
+        # flushed and the size re-read from disk.
+        if self._defer_flush:
+            self._size += self._pending
+        else:
+            self._flush_and_sync()
+
+    def _flush_and_sync(self):
+        with self.lock:
+            super().flush()
+            if self.stream is not None:
+                self._sync_size(self.stream)
+
+    def _flush_loop(self):
+        while not self._closed.wait(LOG_FLUSH_INTERVAL):
+            self._flush_and_sync()
+
+    def close(self):
+        self._closed.set()
+        super().close()
 
 
 class JsonFormatter(logging.Formatter):
@@ -25,18 +152,64 @@ class JsonFormatter(logging.Formatter):
     Each log record becomes a single JSON line::
 
         {"ts":"2025-01-15T12:00:00Z","level":"INFO","logger":"gateway","msg":"..."}
+
+    The line is assembled directly with the C string escaper that
+    ``json.dumps`` uses internally, skipping the intermediate dict and the
+    generic encoder.  The timestamp only has one-second resolution, so the
+    formatted string is reused for every record within the same second.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted ts) — one tuple so a reader on another
+        # thread never pairs a second with the wrong string.
+        self._ts_cache = (None, "")
+
+    def _timestamp(self, created):
+        second = int(created)
+        cached_second, ts = self._ts_cache
+        if second != cached_second:
+            ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+            self._ts_cache = (second, ts)
+        return ts
+
     def format(self, record):
-        entry = {
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(record.created)),
-            "level": record.levelname,
-            "logger": record.name,
-            "msg": record.getMessage(),
-        }
+        line = (
+            '{"ts":"' + self._timestamp(record.created)
+            + '","level":' + _json_str(record.levelname)
+            + ',"logger":' + _json_str(record.name)
+            + ',"msg":' + _json_str(record.getMessage())
+        )
         if record.exc_info and record.exc_info[0]:
-            entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(entry, default=str)
+            line += ',"exception":' + _json_str(self.formatException(record.exc_info))
+        return line + "}"
+
+
+def _is_writable_log(path):
+    """True if *path* can be opened for append, checked without opening it.
+
+    Probing with ``os.access`` avoids constructing the handler just to
+    catch ``PermissionError`` when, e.g., a system log dir is root-owned.
+    """
+    directory = os.path.dirname(path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return False
+    if os.path.exists(path):
+        return os.access(path, os.W_OK)
+    return os.access(directory, os.W_OK)
+
+
+def _fallback_log_path(log_file):
+    """Return the per-user default log path, or None if that isn't usable either."""
+    try:
+        fallback = default_log_path()
+    except OSError:
+        return None
+    if fallback != log_file and _is_writable_log(fallback):
+        return fallback
+    return None
 
 
 def setup_logging(level=logging.INFO, log_file=None, console_level=None,
@@ -44,7 +217,9 @@ def setup_logging(level=logging.INFO, log_file=None, console_level=None,
     """Configure project-wide logging.  Safe to call multiple times.
 
     Uses handler-level filtering (adopted from MeshForge) so the console
-    can be quieter while the file handler captures full detail.
+    can be quieter while the file handler captures full detail.  The root
+    logger gets a single QueueHandler; console and file output happen on
+    a background QueueListener thread that is flushed at interpreter exit.
 
     Args:
         level: Root logger level (default INFO).
@@ -53,7 +228,7 @@ def setup_logging(level=logging.INFO, log_file=None, console_level=None,
                        (e.g. WARNING for TUI mode).  Defaults to *level*.
         structured: Use JSON structured logging format (default False).
     """
-    global _configured
+    global _configured, _listener
     if _configured:
         return
     _configured = True
@@ -67,29 +242,65 @@ def setup_logging(level=logging.INFO, log_file=None, console_level=None,
 
     root = logging.getLogger()
     root.setLevel(level)
+    if _has_tagged_handler(root, "queue"):
+        return
 
     # Console handler — level can be raised independently of root
     console = logging.StreamHandler()
     console.setLevel(console_level or level)
     console.setFormatter(formatter)
-    root.addHandler(console)
+    handlers = [console]
 
     # Optional rotating file handler — always captures at root level
+    requested_log_file = log_file
+    if log_file and not _is_writable_log(log_file):
+        log_file = _fallback_log_path(log_file)
     if log_file:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=1_000_000, backupCount=3,
+        # delay=True: the fd is only opened when the first record arrives
+        file_handler = _BufferedRotatingFileHandler(
+            log_file, maxBytes=1_000_000, backupCount=3, delay=True,
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Root only enqueues; the listener thread does the blocking writes.
+    log_queue = queue.SimpleQueue()
+    queue_handler = _LocalQueueHandler(log_queue)
+    setattr(queue_handler, _HANDLER_TAG, "queue")
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True,
+    )
+    _listener.start()
+    atexit.register(_stop_listener)
+
+    if requested_log_file and log_file != requested_log_file:
+        logging.getLogger("log").warning(
+            "Log file %s is not writable; logging to %s",
+            requested_log_file, log_file or "console only",
+        )
 
 
+def _stop_listener():
+    """Drain queued records, flush buffered output, stop the listener (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+@functools.lru_cache(maxsize=1)
 def default_log_dir():
     """Return the standard log directory for this project.
 
     Uses ``~/.config/rns-gateway/logs/``, respecting ``SUDO_USER``
-    so logs land in the real user's home even under sudo.
+    so logs land in the real user's home even under sudo.  Resolved
+    (and created) once per process; tests that patch the home directory
+    call ``default_log_dir.cache_clear()``.
     """
     from src.utils.common import get_real_user_home
     log_dir = os.path.join(get_real_user_home(), ".config", "rns-gateway", "logs")
@@ -107,16 +318,30 @@ def install_crash_handler():
 
     Adopted from MeshForge ``launcher_tui/main.py`` — ensures unhandled
     exceptions are persisted to disk even if the TUI corrupts the terminal.
+
+    The crash log is opened here, while the process is still healthy, and
+    the hook emits the whole report with a single ``os.write`` — no file
+    object to allocate and no per-line writes at the moment things are
+    going wrong.
     """
     crash_log = os.path.join(default_log_dir(), "crash.log")
+    try:
+        fd = os.open(crash_log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    except OSError:
+        fd = None
+    else:
+        atexit.register(os.close, fd)
 
     def handler(exc_type, exc_value, exc_tb):
-        try:
-            with open(crash_log, "a") as f:
-                f.write(f"\n--- {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-                traceback.print_exception(exc_type, exc_value, exc_tb, file=f)
-        except OSError:
-            pass
+        if fd is not None:
+            report = (
+                f"\n--- {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n"
+                + "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+            )
+            try:
+                os.write(fd, report.encode("utf-8", "replace"))
+            except OSError:
+                pass
         sys.__excepthook__(exc_type, exc_value, exc_tb)
 
     sys.excepthook = handler
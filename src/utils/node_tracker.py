@@ -14,6 +14,7 @@ Usage:
     tracker.stop()   # unsubscribes, persists
 """
 
+import heapq
 import json
 import logging
 import os
@@ -41,6 +42,10 @@ class NodeInfo:
     rssi: Optional[int] = None
 
 
+def _by_last_seen(node: NodeInfo) -> float:
+    return node.last_seen
+
+
 def _default_nodes_path() -> str:
     """Return default persistence path: ~/.config/rns-gateway/nodes.json."""
     from src.utils.common import get_real_user_home
@@ -225,12 +230,21 @@ class NodeTracker:
         self.save()
         log.info("Node tracker stopped (%d nodes persisted)", len(self._nodes))
 
-    def get_all_nodes(self) -> List[Dict]:
-        """Return all known nodes as a list of dicts (sorted by last_seen desc)."""
+    def get_all_nodes(self, limit: Optional[int] = None) -> List[Dict]:
+        """Return known nodes as a list of dicts (sorted by last_seen desc).
+
+        With *limit*, only the most recently seen *limit* nodes are
+        selected and converted, so a dashboard showing the top few does
+        not pay for every node.  Use ``node_count`` for the total.
+        """
         with self._lock:
-            nodes = [asdict(n) for n in self._nodes.values()]
-        nodes.sort(key=lambda n: n.get("last_seen", 0), reverse=True)
-        return nodes
+            if limit is None:
+                recent = sorted(self._nodes.values(),
+                                key=_by_last_seen, reverse=True)
+            else:
+                recent = heapq.nlargest(limit, self._nodes.values(),
+                                        key=_by_last_seen)
+            return [asdict(n) for n in recent]
 
     def get_node(self, node_id: str) -> Optional[Dict]:
         """Return info for a specific node, or None."""
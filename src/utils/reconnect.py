@@ -24,7 +24,7 @@ log = logging.getLogger("reconnect")
 
 @dataclass
 class ReconnectStrategy:
-    """Manages reconnection attempts with exponential backoff + jitter.
+    """Manages reconnection attempts with exponential backoff + decorrelated jitter.
 
     Usage:
         strategy = ReconnectStrategy.for_meshtastic()
@@ -47,21 +47,51 @@ class ReconnectStrategy:
     # Mutable state (not part of __init__ comparison)
     _attempts: int = field(default=0, repr=False, compare=False)
     _recovery_start: float = field(default=0.0, repr=False, compare=False)
+    # Capped backoff curve, one entry per attempt (built in __post_init__)
+    _delays: tuple = field(default=(), init=False, repr=False, compare=False)
+    # Last jittered delay handed out (decorrelated jitter state)
+    _prev_delay: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._delays = tuple(
+            max(0.0, min(self.initial_delay * (self.multiplier ** i), self.max_delay))
+            for i in range(max(self.max_attempts, 1))
+        )
+        self._prev_delay = self.initial_delay
 
     def get_delay(self, attempt: int = -1) -> float:
-        """Calculate delay for the given attempt with exponential backoff + jitter.
+        """Calculate the next backoff delay.
+
+        With ``jitter > 0`` this uses decorrelated jitter (AWS
+        architecture blog): each delay is drawn uniformly from
+        ``[initial_delay, 3 * previous_delay]`` and capped at
+        ``max_delay``.  Unlike proportional jitter around a shared
+        exponential curve, gateways that lost their radio at the same
+        moment (site power blip) drift apart instead of retrying in
+        lock-step.  The draw depends on the previous delay, not
+        *attempt*.
+
+        With ``jitter == 0`` the deterministic exponential curve
+        ``initial_delay * multiplier ** attempt`` is returned.
 
         Args:
-            attempt: Attempt number (0-based). Defaults to current internal count.
+            attempt: Attempt number (0-based) for the deterministic curve.
+                     Defaults to current internal count.
 
         Returns:
-            Delay in seconds with jitter applied.
+            Delay in seconds.
         """
+        if self.jitter > 0:
+            upper = max(self.initial_delay, self._prev_delay * 3)
+            delay = min(self.max_delay, random.uniform(self.initial_delay, upper))
+            self._prev_delay = delay
+            return max(0.0, delay)
+
         if attempt < 0:
             attempt = self._attempts
-        base = min(self.initial_delay * (self.multiplier ** attempt), self.max_delay)
-        jitter_range = base * self.jitter
-        return base + random.uniform(-jitter_range, jitter_range)
+        if attempt < len(self._delays):
+            return self._delays[attempt]
+        return max(0.0, min(self.initial_delay * (self.multiplier ** attempt), self.max_delay))
 
     def should_retry(self) -> bool:
         """Check whether more retry attempts are available."""
@@ -77,6 +107,7 @@ class ReconnectStrategy:
             # Only start slow-start if we were actually recovering
             self._recovery_start = time.monotonic()
         self._attempts = 0
+        self._prev_delay = self.initial_delay
 
     @property
     def attempts(self) -> int:
@@ -94,6 +125,8 @@ class ReconnectStrategy:
             True if the wait completed normally, False if interrupted.
         """
         delay = timeout if timeout >= 0 else self.get_delay()
+        if delay <= 0:
+            return not stop_event.is_set()
         return not stop_event.wait(delay)
 
     def throughput_factor(self) -> float:
@@ -103,6 +136,7 @@ class ReconnectStrategy:
         over ``slow_start_duration`` seconds.  Returns 1.0 when no
         slow-start is active.
         """
+        # Not recovering is the overwhelmingly common case: no clock read.
         if self._recovery_start <= 0 or self.slow_start_duration <= 0:
             return 1.0
         elapsed = time.monotonic() - self._recovery_start
@@ -118,6 +152,8 @@ class ReconnectStrategy:
         Returns 0.0 when at full throughput.  Maximum delay at start
         of recovery is ~0.9s, ramping down to 0.
         """
+        if self._recovery_start <= 0:
+            return 0.0
         factor = self.throughput_factor()
         if factor >= 1.0:
             return 0.0
@@ -163,9 +199,10 @@ class ReconnectStrategy:
         raise ConnectionError("Retry interrupted")
 
     def reset(self) -> None:
-        """Explicitly reset the attempt counter and slow-start state."""
+        """Explicitly reset the attempt counter, jitter and slow-start state."""
         self._attempts = 0
         self._recovery_start = 0.0
+        self._prev_delay = self.initial_delay
 
     @classmethod
     def for_meshtastic(cls) -> 'ReconnectStrategy':
@@ -237,18 +274,24 @@ class SlowStartRecovery:
         self._active = False
         self._start_time = 0.0
 
-    @property
-    def is_active(self) -> bool:
-        """True if slow-start is in progress."""
-        if not self._active:
-            return False
-        if self.duration <= 0:
-            return False
+    def _elapsed(self) -> float:
+        """Seconds into the ramp, or -1.0 if slow-start is not in progress.
+
+        Reads the clock at most once and only while active, so callers
+        on the per-packet path pay nothing outside recovery.
+        """
+        if not self._active or self.duration <= 0:
+            return -1.0
         elapsed = time.monotonic() - self._start_time
         if elapsed >= self.duration:
             self._active = False
-            return False
-        return True
+            return -1.0
+        return elapsed
+
+    @property
+    def is_active(self) -> bool:
+        """True if slow-start is in progress."""
+        return self._elapsed() >= 0
 
     def get_throughput_multiplier(self) -> float:
         """Return current throughput multiplier (min_factor → 1.0).
@@ -256,9 +299,9 @@ class SlowStartRecovery:
         Linear ramp from min_factor to 1.0 over ``duration`` seconds.
         Returns 1.0 when not active.
         """
-        if not self.is_active:
+        elapsed = self._elapsed()
+        if elapsed < 0:
             return 1.0
-        elapsed = time.monotonic() - self._start_time
         progress = min(1.0, elapsed / self.duration)
         return self.min_factor + (1.0 - self.min_factor) * progress
 
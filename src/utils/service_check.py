@@ -5,10 +5,67 @@ Used by both terminal and web dashboards.
 Includes TCP/serial pre-flight probes adopted from MeshForge's
 service_check.py and startup_checks.py patterns.
 """
+import concurrent.futures
+import functools
 import os
+import re
+import shutil
 import socket
+import stat
+import struct
+import subprocess
+import sys
+import time
 
-from src.utils.timeouts import SUBPROCESS_QUICK, TCP_PREFLIGHT
+from src.utils import common
+from src.utils.timeouts import (
+    SERVICE_CHECK_TTL,
+    SUBPROCESS_QUICK,
+    TCP_PREFLIGHT,
+    TCP_PREFLIGHT_LOCAL,
+)
+
+_LOOPBACK_HOSTS = frozenset(("127.0.0.1", "localhost", "::1"))
+
+# struct linger {l_onoff=1, l_linger=0}
+_LINGER_RST = struct.pack("ii", 1, 0)
+
+# (probe name, args, kwargs) -> (monotonic timestamp, result)
+_probe_cache = {}
+
+# process name -> PIDs from the last successful pgrep
+_pid_cache = {}
+
+
+def _ttl_cached(fn):
+    """Memoize a probe's result for ``SERVICE_CHECK_TTL`` seconds per argument set."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        hit = _probe_cache.get(key)
+        if hit is not None and now - hit[0] < SERVICE_CHECK_TTL:
+            return hit[1]
+        result = fn(*args, **kwargs)
+        _probe_cache[key] = (now, result)
+        return result
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd):
+    """Resolve *cmd* on PATH once per process.
+
+    A host without pgrep/systemctl stays that way, so there is no point
+    paying a fork+exec on every poll just to hit FileNotFoundError.
+    """
+    return shutil.which(cmd)
+
+
+def clear_probe_cache():
+    """Drop all memoized probe results (e.g. after starting/stopping a service)."""
+    _probe_cache.clear()
+    _pid_cache.clear()
 
 
 def check_rns_lib():
@@ -29,6 +86,32 @@ def check_meshtastic_lib():
         return False, "not installed"
 
 
+@functools.lru_cache(maxsize=1)
+def get_platform_info():
+    """Return static host facts for the dashboards' System panel.
+
+    OS, kernel release, hostname and interpreter version do not change
+    while the process runs, so they are gathered once and every later
+    render is a dict lookup.  On POSIX a single ``os.uname()`` supplies
+    the OS fields; ``platform`` is only imported on Windows, where it
+    has to emulate uname.
+
+    Returns dict with keys: system, release, hostname, python.
+    """
+    if os.name == "nt":
+        import platform
+        system, release, hostname = platform.system(), platform.release(), platform.node()
+    else:
+        uname = os.uname()
+        system, release, hostname = uname.sysname, uname.release, uname.nodename
+    return {
+        "system": system,
+        "release": release,
+        "hostname": hostname,
+        "python": "%d.%d.%d" % sys.version_info[:3],
+    }
+
+
 def check_serial_ports():
     """List serial ports if pyserial is available. Returns list of strings."""
     try:
@@ -41,23 +124,55 @@ def check_serial_ports():
 
 def check_rns_config():
     """Check if Reticulum config directory exists and has a config file."""
-    from src.utils.common import RNS_CONFIG_FILE
-    if os.path.isfile(RNS_CONFIG_FILE):
-        size = os.path.getsize(RNS_CONFIG_FILE)
-        return True, f"{size} bytes"
+    try:
+        st = os.stat(common.RNS_CONFIG_FILE)
+    except OSError:
+        return False, "not found"
+    if stat.S_ISREG(st.st_mode):
+        return True, f"{st.st_size} bytes"
     return False, "not found"
 
 
-def check_rnsd_status():
-    """Check if rnsd process is running. Returns (running: bool, detail: str)."""
-    import subprocess
+def _pids_alive(name, pids):
+    """True if every PID in *pids* is still a process whose comm is *name*.
+
+    One /proc read per PID (Linux) instead of a pgrep fork+exec.  The
+    comm check also catches a PID recycled by an unrelated process.
+    Returns False when /proc is unavailable so the caller re-runs pgrep.
+    """
+    expected = name.encode()
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/comm", "rb") as f:
+                if f.read().strip() != expected:
+                    return False
+        except OSError:
+            return False
+    return True
+
+
+def _pgrep(name):
+    """Find processes named exactly *name*.  Returns (running: bool, detail: str).
+
+    PIDs from the last successful pgrep are re-verified via /proc first;
+    pgrep only runs when that check fails (first call, process exited,
+    or non-Linux host).
+    """
+    pids = _pid_cache.get(name)
+    if pids and _pids_alive(name, pids):
+        return True, f"PID(s): {', '.join(pids)}"
+    _pid_cache.pop(name, None)
+
+    if _which('pgrep') is None:
+        return False, "cannot check (pgrep unavailable)"
     try:
         result = subprocess.run(
-            ['pgrep', '-x', 'rnsd'],
+            ['pgrep', '-x', name],
             capture_output=True, text=True, timeout=SUBPROCESS_QUICK,
         )
         if result.returncode == 0:
             pids = result.stdout.strip().split('\n')
+            _pid_cache[name] = pids
             return True, f"PID(s): {', '.join(pids)}"
         return False, "not running"
     except FileNotFoundError:
@@ -66,49 +181,54 @@ def check_rnsd_status():
         return False, "check timed out"
 
 
+@_ttl_cached
+def check_rnsd_status():
+    """Check if rnsd process is running. Returns (running: bool, detail: str)."""
+    return _pgrep('rnsd')
+
+
+@_ttl_cached
 def check_meshtasticd_status():
     """Check if meshtasticd service is running.
 
     Tries systemctl first (SSOT for systemd), then falls back to pgrep.
     Returns (running: bool, detail: str).
     """
-    import subprocess
-
     # Prefer systemctl (single source of truth for systemd services)
-    try:
-        result = subprocess.run(
-            ['systemctl', 'is-active', 'meshtasticd'],
-            capture_output=True, text=True, timeout=SUBPROCESS_QUICK,
-        )
-        state = result.stdout.strip()
-        if state == 'active':
-            # Verify port is actually listening (catches zombies)
-            port_ok, _ = check_tcp_port(4403)
-            if port_ok:
-                return True, "active (systemd) [port 4403 listening]"
-            return True, "active (systemd) [WARNING: port 4403 not listening]"
-        return False, f"{state} (systemd)"
-    except FileNotFoundError:
-        pass  # systemctl not available, fall through
-    except subprocess.TimeoutExpired:
-        return False, "check timed out"
+    if _which('systemctl') is not None:
+        try:
+            result = subprocess.run(
+                ['systemctl', 'is-active', 'meshtasticd'],
+                capture_output=True, text=True, timeout=SUBPROCESS_QUICK,
+            )
+            state = result.stdout.strip()
+            if state == 'active':
+                # Verify port is actually listening (catches zombies)
+                port_ok, _ = check_tcp_port(4403)
+                if port_ok:
+                    return True, "active (systemd) [port 4403 listening]"
+                return True, "active (systemd) [WARNING: port 4403 not listening]"
+            return False, f"{state} (systemd)"
+        except FileNotFoundError:
+            pass  # systemctl vanished since lookup, fall through
+        except subprocess.TimeoutExpired:
+            return False, "check timed out"
 
     # Fallback: pgrep
-    try:
-        result = subprocess.run(
-            ['pgrep', '-x', 'meshtasticd'],
-            capture_output=True, text=True, timeout=SUBPROCESS_QUICK,
-        )
-        if result.returncode == 0:
-            pids = result.stdout.strip().split('\n')
-            return True, f"PID(s): {', '.join(pids)}"
-        return False, "not running"
-    except FileNotFoundError:
-        return False, "cannot check (pgrep unavailable)"
-    except subprocess.TimeoutExpired:
-        return False, "check timed out"
+    return _pgrep('meshtasticd')
+
 
+@functools.lru_cache(maxsize=8)
+def _udp_local_port_re(port):
+    """Compiled matcher for *port* in the local_address column of /proc/net/udp.
 
+    Rows look like ``   0: 00000000:9234 00000000:0000 07 ...``; anchoring
+    on the slot number keeps the remote-address column from matching.
+    """
+    return re.compile(rb'^\s*\d+:\s+[0-9A-F]+:%b\s' % f'{port:04X}'.encode(), re.MULTILINE)
+
+
+@_ttl_cached
 def check_rns_udp_port(port=37428):
     """Check if RNS UDP port is in use.
 
@@ -119,15 +239,11 @@ def check_rns_udp_port(port=37428):
     """
     # Linux: passive scan — no socket contention
     if os.path.isfile('/proc/net/udp'):
-        hex_port = f'{port:04X}'
         try:
-            with open('/proc/net/udp', 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) >= 2 and ':' in parts[1]:
-                        local_port = parts[1].split(':')[1]
-                        if local_port == hex_port:
-                            return True, f"UDP :{port} in use (passive scan)"
+            with open('/proc/net/udp', 'rb') as f:
+                data = f.read()
+            if _udp_local_port_re(port).search(data):
+                return True, f"UDP :{port} in use (passive scan)"
             return False, f"UDP :{port} not in use"
         except (OSError, PermissionError):
             pass  # fall through to socket probe
@@ -144,20 +260,26 @@ def check_rns_udp_port(port=37428):
 
 
 # ── Pre-flight probes (MeshForge patterns) ──────────────────
-def check_tcp_port(port, host="127.0.0.1", timeout=TCP_PREFLIGHT):
+@_ttl_cached
+def check_tcp_port(port, host="127.0.0.1", timeout=None):
     """Check if a TCP port is accepting connections.
 
     Returns (listening: bool, detail: str).
     Catches zombie processes where systemctl says 'active' but the
-    port is not actually bound.
+    port is not actually bound.  *timeout* defaults to
+    ``TCP_PREFLIGHT_LOCAL`` for loopback hosts and ``TCP_PREFLIGHT``
+    otherwise.
     """
+    if timeout is None:
+        timeout = TCP_PREFLIGHT_LOCAL if host in _LOOPBACK_HOSTS else TCP_PREFLIGHT
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            if result == 0:
-                return True, "TCP :%d listening" % port
-            return False, "TCP :%d not listening" % port
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            # Abortive close (RST): a probe every poll would otherwise
+            # leave a TIME_WAIT entry per call on the local 4-tuple.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+            return True, "TCP :%d listening" % port
+    except (ConnectionRefusedError, socket.timeout):
+        return False, "TCP :%d not listening" % port
     except OSError as e:
         return False, "TCP :%d check failed: %s" % (port, e)
 
@@ -193,3 +315,34 @@ def check_serial_ports_detailed():
         return result if result else []
     except ImportError:
         return []
+
+
+# ── Concurrent probe runner ─────────────────────────────────
+def run_all_checks(checks=None):
+    """Run independent probes concurrently and return ``{name: result}``.
+
+    The probes are I/O-bound (pgrep/systemctl forks, socket connects,
+    /proc reads), so running them on a small thread pool makes a status
+    page cost the slowest probe rather than the sum of all of them.
+    Exceptions from a probe propagate to the caller, as they would if
+    the probes were called in sequence.
+
+    Args:
+        checks: Optional ``{name: zero-arg callable}`` mapping.  Defaults
+                to the standard dashboard set.
+    """
+    if checks is None:
+        checks = {
+            "rns_lib": check_rns_lib,
+            "meshtastic_lib": check_meshtastic_lib,
+            "serial_ports": check_serial_ports,
+            "rns_config": check_rns_config,
+            "rnsd": check_rnsd_status,
+            "meshtasticd": check_meshtasticd_status,
+            "rns_udp": check_rns_udp_port,
+        }
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(len(checks), 1), thread_name_prefix="svc-check",
+    ) as pool:
+        futures = {name: pool.submit(fn) for name, fn in checks.items()}
+        return {name: fut.result() for name, fut in futures.items()}
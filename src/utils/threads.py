@@ -17,6 +17,7 @@ Usage:
 """
 import logging
 import threading
+import time
 from typing import Callable, Dict, List, Optional
 
 from src.utils.timeouts import THREAD_JOIN
@@ -80,52 +81,71 @@ class ThreadManager:
             True if thread stopped, False if still running.
         """
         with self._lock:
-            if name in self._stop_events:
-                self._stop_events[name].set()
+            event = self._stop_events.get(name)
+            if event is not None:
+                event.set()
                 log.debug("Signalled stop for thread: %s", name)
+            thread = next((t for t in self._threads if t.name == name), None)
 
-            for thread in self._threads:
-                if thread.name == name:
-                    thread.join(timeout=timeout)
-                    if thread.is_alive():
-                        log.warning("Thread %s did not stop within %.1fs", name, timeout)
-                        return False
-                    self._threads.remove(thread)
-                    self._stop_events.pop(name, None)
-                    log.debug("Thread %s stopped", name)
-                    return True
+        if thread is None:
+            log.warning("Thread %s not found", name)
+            return False
 
-        log.warning("Thread %s not found", name)
-        return False
+        # Join without holding _lock so other callers aren't stalled
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            log.warning("Thread %s did not stop within %.1fs", name, timeout)
+            return False
+
+        with self._lock:
+            if thread in self._threads:
+                self._threads.remove(thread)
+            # A new thread may have been started under this name while we
+            # joined; only drop the event we signalled, not its replacement.
+            if event is not None and self._stop_events.get(name) is event:
+                del self._stop_events[name]
+        log.debug("Thread %s stopped", name)
+        return True
 
     def shutdown(self, timeout: float = THREAD_JOIN) -> int:
         """Stop all managed threads.
 
+        Every stop event is signalled first, then all threads share one
+        *timeout* budget, so worst-case shutdown is *timeout* rather than
+        N * *timeout*.  Joins happen outside ``_lock`` so a slow thread
+        does not block start_thread() or running_threads.
+
         Args:
-            timeout: Seconds to wait for each thread.
+            timeout: Total seconds to wait for all threads.
 
         Returns:
             Number of threads that didn't stop in time.
         """
         with self._lock:
-            count = len(self._threads)
-            log.info("Shutting down %d managed thread(s)...", count)
+            threads = self._threads[:]
+            log.info("Shutting down %d managed thread(s)...", len(threads))
 
             # Signal all stop events first
             for _name, event in self._stop_events.items():
                 event.set()
+            self._stop_events.clear()
 
-            # Wait for threads to finish
-            still_running = 0
-            for thread in self._threads[:]:
-                thread.join(timeout=timeout)
-                if thread.is_alive():
-                    log.warning("Thread %s still running after shutdown", thread.name)
-                    still_running += 1
-                else:
-                    self._threads.remove(thread)
+        # Wait for threads to finish against a single deadline
+        deadline = time.monotonic() + timeout
+        stopped = []
+        still_running = 0
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                log.warning("Thread %s still running after shutdown", thread.name)
+                still_running += 1
+            else:
+                stopped.append(thread)
 
-            self._stop_events.clear()
+        with self._lock:
+            for thread in stopped:
+                if thread in self._threads:
+                    self._threads.remove(thread)
 
         if still_running:
             log.warning("%d thread(s) still running after shutdown", still_running)
@@ -16,6 +16,13 @@ Usage:
 # Interval between active health probe checks
 HEALTH_CHECK_INTERVAL = 30  # seconds
 
+# =============================================================================
+# Logging
+# =============================================================================
+
+# Max time buffered INFO/DEBUG lines sit in the log file buffer before flush
+LOG_FLUSH_INTERVAL = 30.0  # seconds
+
 # =============================================================================
 # Subprocess Timeouts
 # =============================================================================
@@ -36,6 +43,10 @@ TCP_CONNECT = 10  # seconds
 # TCP pre-flight probe (quick connectivity check)
 TCP_PREFLIGHT = 2  # seconds
 
+# TCP pre-flight probe against loopback — a local listener answers (or
+# RSTs) in well under a millisecond, so a dead port shouldn't stall 2s
+TCP_PREFLIGHT_LOCAL = 0.2  # seconds
+
 # =============================================================================
 # Circuit Breaker
 # =============================================================================
@@ -80,6 +91,9 @@ TX_QUEUE_MAXSIZE = 32
 # Drain thread poll interval
 TX_QUEUE_POLL = 0.5  # seconds
 
+# Most packets the drain thread takes per wake-up
+TX_QUEUE_BATCH = 16
+
 # =============================================================================
 # TUI Menu
 # =============================================================================
@@ -87,6 +101,11 @@ TX_QUEUE_POLL = 0.5  # seconds
 # Service status cache TTL (avoid shelling out on every menu redraw)
 STATUS_CACHE_TTL = 10.0  # seconds
 
+# Short-lived memo for service_check probes, so dashboard pages that poll
+# rnsd/meshtasticd/UDP status together don't repeat the same fork or
+# /proc scan within one refresh
+SERVICE_CHECK_TTL = 1.0  # seconds
+
 # =============================================================================
 # Web Dashboard
 # =============================================================================
@@ -5,11 +5,11 @@ Decouples RNS transport callbacks from radio I/O so that
 process_incoming() never blocks the RNS thread.  Inspired by
 MeshForge's gateway/message_queue.py but stripped to essentials.
 """
+import collections
 import logging
-import queue
 import threading
 
-from src.utils.timeouts import TX_QUEUE_MAXSIZE, TX_QUEUE_POLL
+from src.utils.timeouts import TX_QUEUE_BATCH, TX_QUEUE_MAXSIZE, TX_QUEUE_POLL
 
 log = logging.getLogger("tx_queue")
 
@@ -24,19 +24,29 @@ class TxQueue:
             sleep between packets (e.g. for slow-start recovery).
         on_send_success: Optional callback(data) on successful send.
         on_send_failure: Optional callback(data, exception) on failed send.
+        send_batch_fn: Optional callable that transmits a list of packets
+            in one go.  When set, the inter-packet delay is applied once
+            per batch rather than once per packet.
+        batch_size: Most packets drained per wake-up.
     """
 
     def __init__(self, send_fn, maxsize=TX_QUEUE_MAXSIZE, inter_packet_delay_fn=None,
-                 on_send_success=None, on_send_failure=None):
+                 on_send_success=None, on_send_failure=None, send_batch_fn=None,
+                 batch_size=TX_QUEUE_BATCH):
         self._send_fn = send_fn
-        self._queue = queue.Queue(maxsize=maxsize)
+        self._send_batch_fn = send_batch_fn
+        self._batch_size = max(1, batch_size)
+        # A deque guarded by one Condition: queue.Queue would take its
+        # mutex plus not_empty/not_full conditions for the same job.
+        self._deque = collections.deque()
+        self._maxsize = maxsize
+        self._cv = threading.Condition()
         self._delay_fn = inter_packet_delay_fn
         self._on_success = on_send_success
         self._on_failure = on_send_failure
         self._stop = threading.Event()
         self._thread = None
         self._dropped = 0
-        self._lock = threading.Lock()
 
     def start(self) -> None:
         """Start the drain thread."""
@@ -49,57 +59,111 @@ class TxQueue:
     def stop(self, timeout=2.0) -> None:
         """Signal the drain thread to stop and wait for it."""
         self._stop.set()
+        with self._cv:
+            self._cv.notify()
         if self._thread:
             self._thread.join(timeout=timeout)
             self._thread = None
 
     def enqueue(self, data: bytes) -> bool:
         """Add a packet to the queue.  Returns False on backpressure (queue full)."""
-        try:
-            self._queue.put_nowait(data)
-            return True
-        except queue.Full:
-            with self._lock:
+        with self._cv:
+            if 0 < self._maxsize <= len(self._deque):
+                # Counted under the lock we already hold; no second mutex.
                 self._dropped += 1
-            log.warning("TX queue full — packet dropped (%d total dropped)", self._dropped)
-            return False
+                dropped = self._dropped
+            else:
+                self._deque.append(data)
+                self._cv.notify()
+                return True
+        log.warning("TX queue full — packet dropped (%d total dropped)", dropped)
+        return False
 
     @property
     def dropped(self) -> int:
-        with self._lock:
-            return self._dropped
+        return self._dropped
 
     @property
     def pending(self) -> int:
-        return self._queue.qsize()
+        return len(self._deque)
 
     def _drain(self) -> None:
-        """Drain loop: pull packets and send them."""
-        import time
-
+        """Drain loop: pull packets and send them.
+
+        One condition wait per wake-up, then up to ``batch_size`` packets
+        are popped under the same lock hold, so a burst is handled
+        without a lock round-trip per packet.  The stop flag is still
+        checked before every send; packets not yet sent when stop() is
+        called go back to the head of the queue.
+        """
         while not self._stop.is_set():
-            try:
-                data = self._queue.get(timeout=TX_QUEUE_POLL)
-            except queue.Empty:
+            with self._cv:
+                if not self._deque and not self._stop.is_set():
+                    self._cv.wait(timeout=TX_QUEUE_POLL)
+                n = min(len(self._deque), self._batch_size)
+                batch = [self._deque.popleft() for _ in range(n)]
+            if not batch:
                 continue
 
-            # Inter-packet delay for slow-start recovery
-            if self._delay_fn:
-                delay = self._delay_fn()
-                if delay > 0:
-                    time.sleep(delay)
+            if self._send_batch_fn:
+                self._sleep_inter_packet()
+                if self._stop.is_set():
+                    self._requeue(batch)
+                    return
+                self._send_batch(batch)
+                continue
+
+            for i, data in enumerate(batch):
+                # Inter-packet delay for slow-start recovery
+                self._sleep_inter_packet()
+                if self._stop.is_set():
+                    self._requeue(batch[i:])
+                    return
+                self._send_one(data)
+
+    def _requeue(self, remaining) -> None:
+        """Put unsent packets back at the head of the queue, in order."""
+        with self._cv:
+            self._deque.extendleft(reversed(remaining))
+
+    def _sleep_inter_packet(self) -> None:
+        if self._delay_fn:
+            delay = self._delay_fn()
+            if delay > 0:
+                # Waiting on the stop flag lets stop() cut a slow-start
+                # pause short instead of outlasting its join timeout.
+                self._stop.wait(delay)
+
+    def _send_batch(self, batch) -> None:
+        try:
+            self._send_batch_fn(batch)
+        except Exception as e:
+            log.error("TX drain batch send error (%d packets): %s", len(batch), e)
+            for data in batch:
+                self._notify_failure(data, e)
+            return
+        for data in batch:
+            self._notify_success(data)
+
+    def _send_one(self, data) -> None:
+        try:
+            self._send_fn(data)
+        except Exception as e:
+            log.error("TX drain send error: %s", e)
+            self._notify_failure(data, e)
+            return
+        self._notify_success(data)
+
+    def _notify_success(self, data) -> None:
+        if self._on_success:
+            try:
+                self._on_success(data)
+            except Exception as cb_err:
+                log.debug("TX success callback error: %s", cb_err)
 
+    def _notify_failure(self, data, exc) -> None:
+        if self._on_failure:
             try:
-                self._send_fn(data)
-                if self._on_success:
-                    try:
-                        self._on_success(data)
-                    except Exception as cb_err:
-                        log.debug("TX success callback error: %s", cb_err)
-            except Exception as e:
-                log.error("TX drain send error: %s", e)
-                if self._on_failure:
-                    try:
-                        self._on_failure(data, e)
-                    except Exception as cb_err:
-                        log.debug("TX failure callback error: %s", cb_err)
+                self._on_failure(data, exc)
+            except Exception as cb_err:
+                log.debug("TX failure callback error: %s", cb_err)
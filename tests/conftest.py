@@ -1,15 +1,10 @@
 import json
 import os
-import sys
+import types
 
 import pytest
 from unittest.mock import MagicMock, patch
 
-# Ensure project root is on sys.path so src.* imports work
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
 # Detect CI environment (adopted from MeshForge conftest.py)
 CI = os.environ.get('CI', 'false').lower() == 'true'
 
@@ -42,43 +37,79 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_network)
 
 
-@pytest.fixture
-def tmp_config(tmp_path):
-    """Create a temporary config.json and return its path."""
-    config = {
-        "gateway": {
-            "name": "TestNode",
-            "connection_type": "serial",
-            "port": "/dev/ttyUSB0",
-            "bitrate": 500,
-        },
-        "dashboard": {"host": "127.0.0.1", "port": 5000},
-        "features": {},
-    }
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(config))
+# Read-only fixture payloads; serialized once at import.
+_TMP_CONFIG = {
+    "gateway": {
+        "name": "TestNode",
+        "connection_type": "serial",
+        "port": "/dev/ttyUSB0",
+        "bitrate": 500,
+    },
+    "dashboard": {"host": "127.0.0.1", "port": 5000},
+    "features": {},
+}
+_TMP_CONFIG_JSON = json.dumps(_TMP_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def tmp_config(tmp_path_factory):
+    """Create a temporary config.json once per session and return its path.
+
+    Shared across tests, so treat it as read-only; write a fresh file
+    under ``tmp_path`` if a test needs to modify the config.
+    """
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_file.write_text(_TMP_CONFIG_JSON)
     return str(config_file)
 
 
 @pytest.fixture
-def bad_config(tmp_path):
-    """Create an invalid JSON config file and return its path."""
-    config_file = tmp_path / "config.json"
+def make_config(tmp_path):
+    """Factory for writable config variants under ``tmp_path``.
+
+    ``make_config(gateway={"connection_type": "tcp"})`` merges each
+    keyword into the matching top-level section of the ``tmp_config``
+    payload, writes the result and returns its path.  Without overrides
+    the pre-serialized blob is written as-is.
+    """
+    def _make(name="config.json", **overrides):
+        config_file = tmp_path / name
+        if overrides:
+            cfg = {key: dict(section) for key, section in _TMP_CONFIG.items()}
+            for key, section in overrides.items():
+                cfg.setdefault(key, {}).update(section)
+            config_file.write_text(json.dumps(cfg))
+        else:
+            config_file.write_text(_TMP_CONFIG_JSON)
+        return str(config_file)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def bad_config(tmp_path_factory):
+    """Create an invalid JSON config file once per session and return its path."""
+    config_file = tmp_path_factory.mktemp("bad_cfg") / "config.json"
     config_file.write_text("{invalid json content")
     return str(config_file)
 
 
-@pytest.fixture
-def mock_rns_modules():
-    """Build mock modules for RNS so the interface can import."""
+def _reset_module_mocks(modules):
+    """Clear call history, return values and side effects on shared mocks."""
+    for module in modules.values():
+        if isinstance(module, MagicMock):
+            module.reset_mock(return_value=True, side_effect=True)
+    return modules
+
+
+@pytest.fixture(scope="session")
+def _rns_module_graph():
+    """RNS stand-ins, built once per session (see ``mock_rns_modules``)."""
     mock_rns = MagicMock()
-    mock_rns_interfaces = MagicMock()
-    mock_rns_interface = MagicMock()
-    mock_rns_interface.Interface = type('Interface', (), {
-        'MODE_ACCESS_POINT': 1,
-    })
+    mock_rns_interface = types.ModuleType('RNS.Interfaces.Interface')
+    mock_rns_interface.Interface = type('Interface', (), {'MODE_ACCESS_POINT': 1})
+    mock_rns_interfaces = types.ModuleType('RNS.Interfaces')
+    mock_rns_interfaces.Interface = mock_rns_interface
     mock_rns.Interfaces = mock_rns_interfaces
-    mock_rns.Interfaces.Interface = mock_rns_interface
 
     return {
         'RNS': mock_rns,
@@ -87,9 +118,9 @@ def mock_rns_modules():
     }
 
 
-@pytest.fixture
-def mock_meshtastic_modules():
-    """Build mock modules for meshtastic so the interface can import."""
+@pytest.fixture(scope="session")
+def _meshtastic_module_graph():
+    """meshtastic stand-ins, built once per session (see ``mock_meshtastic_modules``)."""
     mock_mesh = MagicMock()
     mock_serial = MagicMock()
     mock_tcp = MagicMock()
@@ -106,11 +137,30 @@ def mock_meshtastic_modules():
     }
 
 
+@pytest.fixture
+def mock_rns_modules(_rns_module_graph):
+    """Mock modules for RNS so the interface can import.
+
+    The driver only needs ``Interface.MODE_ACCESS_POINT`` from the
+    ``RNS.Interfaces`` submodules, so real modules with explicit
+    attributes stand in for them; ``RNS`` itself stays a MagicMock
+    because tests assert on calls made through it.  The objects are
+    shared for the session (so an imported driver stays bound to them)
+    and reset before each test, since tests set side effects on them.
+    """
+    return _reset_module_mocks(_rns_module_graph)
+
+
+@pytest.fixture
+def mock_meshtastic_modules(_meshtastic_module_graph):
+    """Mock modules for meshtastic, shared per session and reset per test."""
+    return _reset_module_mocks(_meshtastic_module_graph)
+
+
 @pytest.fixture
 def mock_all_modules(mock_rns_modules, mock_meshtastic_modules):
     """Combined RNS + Meshtastic mock modules dict for sys.modules patching.
 
-    Consolidates the duplicated _build_mocks() pattern used in
-    test_meshtastic_interface.py and test_launcher.py.
+    Shared by test_meshtastic_interface.py; mocks are reset for each test.
     """
     return {**mock_rns_modules, **mock_meshtastic_modules}
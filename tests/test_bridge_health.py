@@ -1,5 +1,7 @@
 """Tests for src.utils.bridge_health – BridgeHealthMonitor, DeliveryTracker, and error classification."""
 import time
+from unittest.mock import patch
+
 import pytest
 from src.utils.bridge_health import (
     BridgeHealthMonitor,
@@ -10,6 +12,20 @@ from src.utils.bridge_health import (
 )
 
 
+
+@pytest.fixture
+def fake_clock():
+    """Hand-driven wall clock: advance ``fake_clock[0]`` instead of sleeping."""
+    now = [1_700_000_000.0]
+    with patch('src.utils.bridge_health.time.time', side_effect=lambda: now[0]):
+        yield now
+
+
+def _bring_up(h):
+    """Mark both links connected, as at gateway startup."""
+    h.record_events_bulk([("meshtastic", "connected"), ("rns", "connected")])
+
+
 # ── classify_error ───────────────────────────────────────────
 class TestClassifyError:
     def test_transient_timeout(self):
@@ -41,14 +57,56 @@ class TestClassifyError:
         # by isinstance check
         assert classify_error(OSError("unrecognised")) == "transient"
 
+    @pytest.mark.parametrize("exc_type", [
+        ConnectionError, ConnectionAbortedError, BrokenPipeError,
+        ConnectionResetError, TimeoutError, PermissionError,
+    ])
+    def test_oserror_subclass_fallback_transient(self, exc_type):
+        assert classify_error(exc_type("unrecognised")) == "transient"
+
+    def test_pattern_match_ignores_case(self):
+        assert classify_error(RuntimeError("Permission Denied on /dev/ttyUSB0")) == "permanent"
+        assert classify_error(RuntimeError("Serial Port Busy")) == "transient"
+
+    def test_permanent_pattern_wins_over_transient(self):
+        msg = "permission denied after connection reset"
+        assert classify_error(RuntimeError(msg)) == "permanent"
+
 
 # ── BridgeHealthMonitor ─────────────────────────────────────
-class TestBridgeHealthMonitor:
-    def test_initial_state_offline(self):
-        h = BridgeHealthMonitor()
-        assert h.get_bridge_status() == BridgeStatus.OFFLINE
-        assert not h.is_healthy()
+class TestFreshMonitor:
+    """Read-only checks against a never-connected monitor, built once per class."""
 
+    @pytest.fixture(scope="class")
+    def offline_monitor(self):
+        return BridgeHealthMonitor()
+
+    def test_initial_state_offline(self, offline_monitor):
+        assert offline_monitor.get_bridge_status() == BridgeStatus.OFFLINE
+        assert not offline_monitor.is_healthy()
+
+    def test_degraded_reason(self, offline_monitor):
+        reason = offline_monitor.get_degraded_reason()
+        assert "Meshtastic disconnected" in reason
+        assert "RNS disconnected" in reason
+
+    def test_should_pause_when_offline(self, offline_monitor):
+        assert offline_monitor.should_pause_bridging()
+
+    def test_summary_structure(self, offline_monitor):
+        s = offline_monitor.get_summary()
+        for key in ("uptime_seconds", "connections", "messages", "errors",
+                    "bridge_status", "zero_traffic_services"):
+            assert key in s
+
+    def test_disconnected_subsystem(self, offline_monitor):
+        assert offline_monitor.get_subsystem_state("meshtastic") == SubsystemState.DISCONNECTED
+
+    def test_no_zero_traffic_when_disconnected(self, offline_monitor):
+        assert offline_monitor.check_zero_traffic(min_uptime=0) == []
+
+
+class TestBridgeHealthMonitor:
     def test_single_connect_degraded(self):
         h = BridgeHealthMonitor()
         h.record_connection_event("meshtastic", "connected")
@@ -56,15 +114,13 @@ class TestBridgeHealthMonitor:
 
     def test_both_connected_healthy(self):
         h = BridgeHealthMonitor()
-        h.record_connection_event("meshtastic", "connected")
-        h.record_connection_event("rns", "connected")
+        _bring_up(h)
         assert h.get_bridge_status() == BridgeStatus.HEALTHY
         assert h.is_healthy()
 
     def test_disconnect_degrades(self):
         h = BridgeHealthMonitor()
-        h.record_connection_event("meshtastic", "connected")
-        h.record_connection_event("rns", "connected")
+        _bring_up(h)
         h.record_connection_event("rns", "disconnected")
         assert h.get_bridge_status() == BridgeStatus.DEGRADED
 
@@ -95,45 +151,60 @@ class TestBridgeHealthMonitor:
         rates = h.get_error_rate(window_seconds=60)
         assert rates["transient"] == 1
 
-    def test_message_rate(self):
-        h = BridgeHealthMonitor()
-        for _ in range(10):
-            h.record_message_sent("mesh_to_rns")
-        rate = h.get_message_rate(window_seconds=60)
-        assert rate == pytest.approx(10.0, rel=0.1)
-
-    def test_uptime_percent(self):
+    @pytest.mark.parametrize("n,window,expected", [
+        (10, 60, 10.0),
+        (100, 60, 100.0),
+        (60, 30, 120.0),
+    ])
+    def test_message_rate(self, n, window, expected, fake_clock):
         h = BridgeHealthMonitor()
-        h.record_connection_event("meshtastic", "connected")
-        time.sleep(0.1)
-        pct = h.get_uptime_percent("meshtastic")
-        assert pct > 0
+        h.record_message_sent_bulk("mesh_to_rns", n)
+        assert h.get_message_rate(window_seconds=window) == pytest.approx(expected)
 
-    def test_degraded_reason(self):
+    def test_bulk_matches_individual_recording(self):
+        single, bulk = BridgeHealthMonitor(), BridgeHealthMonitor()
+        for _ in range(5):
+            single.record_message_sent("rns_to_mesh")
+        bulk.record_message_sent_bulk("rns_to_mesh", 5)
+        assert (bulk.get_summary()["messages"]
+                == single.get_summary()["messages"])
+        assert bulk.get_message_rate(60) == single.get_message_rate(60)
+
+    def test_bulk_respects_window_size(self):
+        h = BridgeHealthMonitor(window_size=4)
+        h.record_message_sent_bulk("mesh_to_rns", 10)
+        assert h.get_summary()["messages"]["mesh_to_rns"] == 10
+        assert len(h._message_timestamps) == 4
+
+    def test_bulk_zero_is_noop(self):
         h = BridgeHealthMonitor()
-        reason = h.get_degraded_reason()
-        assert "Meshtastic disconnected" in reason
-        assert "RNS disconnected" in reason
+        h.record_message_sent_bulk("mesh_to_rns", 0)
+        assert h.get_summary()["messages"]["mesh_to_rns"] == 0
 
-    def test_should_pause_when_offline(self):
+    def test_uptime_percent(self, fake_clock):
         h = BridgeHealthMonitor()
-        assert h.should_pause_bridging()
+        fake_clock[0] += 10
+        h.record_connection_event("meshtastic", "connected")
+        fake_clock[0] += 30
+        pct = h.get_uptime_percent("meshtastic")
+        assert pct == pytest.approx(75.0)
+
+    def test_bulk_events_match_individual_calls(self, fake_clock):
+        events = [("meshtastic", "connected"), ("rns", "connected"),
+                  ("meshtastic", "disconnected", "usb unplugged"),
+                  ("meshtastic", "connected")]
+        single, bulk = BridgeHealthMonitor(), BridgeHealthMonitor()
+        for ev in events:
+            single.record_connection_event(*ev)
+        bulk.record_events_bulk(events)
+        assert bulk.get_summary() == single.get_summary()
+        assert list(bulk._connection_events) == list(single._connection_events)
 
     def test_should_not_pause_when_connected(self):
         h = BridgeHealthMonitor()
-        h.record_connection_event("meshtastic", "connected")
-        h.record_connection_event("rns", "connected")
+        _bring_up(h)
         assert not h.should_pause_bridging()
 
-    def test_summary_structure(self):
-        h = BridgeHealthMonitor()
-        s = h.get_summary()
-        assert "uptime_seconds" in s
-        assert "connections" in s
-        assert "messages" in s
-        assert "errors" in s
-        assert "bridge_status" in s
-
     def test_reconnect_count(self):
         h = BridgeHealthMonitor()
         h.record_connection_event("meshtastic", "connected")
@@ -145,10 +216,6 @@ class TestBridgeHealthMonitor:
 
 # ── SubsystemState ──────────────────────────────────────────
 class TestSubsystemState:
-    def test_disconnected_when_not_connected(self):
-        h = BridgeHealthMonitor()
-        assert h.get_subsystem_state("meshtastic") == SubsystemState.DISCONNECTED
-
     def test_healthy_when_connected(self):
         h = BridgeHealthMonitor()
         h.record_connection_event("meshtastic", "connected")
@@ -170,10 +237,6 @@ class TestSubsystemState:
 
 # ── Zero-Traffic Detection ──────────────────────────────────
 class TestZeroTraffic:
-    def test_no_zero_traffic_when_disconnected(self):
-        h = BridgeHealthMonitor()
-        assert h.check_zero_traffic(min_uptime=0) == []
-
     def test_no_zero_traffic_when_messages_flowing(self):
         h = BridgeHealthMonitor()
         h.record_connection_event("meshtastic", "connected")
@@ -194,11 +257,6 @@ class TestZeroTraffic:
         # Just connected — should not flag
         assert h.check_zero_traffic(min_uptime=120) == []
 
-    def test_summary_includes_zero_traffic(self):
-        h = BridgeHealthMonitor()
-        s = h.get_summary()
-        assert "zero_traffic_services" in s
-
     def test_one_service_traffic_does_not_mask_another_service_silent(self):
         """PR #32 follow-up: rns traffic should not hide a dead meshtastic.
 
@@ -207,8 +265,7 @@ class TestZeroTraffic:
         chatty rns side masked a dead meshtastic radio.
         """
         h = BridgeHealthMonitor()
-        h.record_connection_event("meshtastic", "connected")
-        h.record_connection_event("rns", "connected")
+        _bring_up(h)
         # Make both connections old enough to qualify
         h._last_connected["meshtastic"] = time.time() - 300
         h._last_connected["rns"] = time.time() - 300
@@ -277,10 +334,10 @@ class TestDeliveryTracker:
         stats = t.get_stats()
         assert stats["failed"] == 1
 
-    def test_timeout_sweep(self):
+    def test_timeout_sweep(self, fake_clock):
         t = DeliveryTracker(timeout=0.01)
         t.register()
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         swept = t.sweep_timeouts()
         assert swept == 1
         stats = t.get_stats()
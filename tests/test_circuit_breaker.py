@@ -1,27 +1,46 @@
 """Tests for src/utils/circuit_breaker.py — circuit breaker state machine."""
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
 from src.utils.circuit_breaker import CircuitBreaker, State, circuit_protected
 
 
+@pytest.fixture
+def fake_clock():
+    """Hand-driven monotonic clock: advance ``fake_clock[0]`` instead of sleeping."""
+    now = [1000.0]
+    with patch('src.utils.circuit_breaker.time.monotonic', side_effect=lambda: now[0]):
+        yield now
+
+
 class TestInitialState:
-    def test_starts_closed(self):
-        cb = CircuitBreaker()
-        assert cb.state is State.CLOSED
+    """Read-only checks against one untouched breaker, built once per class."""
 
-    def test_starts_with_zero_failures(self):
-        cb = CircuitBreaker()
-        assert cb.failures == 0
+    @pytest.fixture(scope="class")
+    def fresh_breaker(self):
+        return CircuitBreaker(name="test")
 
+    def test_starts_closed(self, fresh_breaker):
+        assert fresh_breaker.state is State.CLOSED
+
+    def test_starts_with_zero_failures(self, fresh_breaker):
+        assert fresh_breaker.failures == 0
+
+    def test_allows_when_closed(self, fresh_breaker):
+        assert fresh_breaker.allow_request() is True
+
+    def test_initial_stats(self, fresh_breaker):
+        stats = fresh_breaker.get_stats()
+        assert stats["name"] == "test"
+        assert stats["total_successes"] == 0
+        assert stats["total_failures"] == 0
+        assert stats["total_trips"] == 0
 
-class TestAllowRequest:
-    def test_allows_when_closed(self):
-        cb = CircuitBreaker()
-        assert cb.allow_request() is True
 
+class TestAllowRequest:
     def test_blocks_when_open(self):
         cb = CircuitBreaker(failure_threshold=2)
         cb.record_failure()
@@ -29,11 +48,11 @@ class TestAllowRequest:
         assert cb.state is State.OPEN
         assert cb.allow_request() is False
 
-    def test_allows_when_half_open(self):
+    def test_allows_when_half_open(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
         assert cb.state is State.OPEN
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
         assert cb.allow_request() is True
 
@@ -51,25 +70,25 @@ class TestStateTransitions:
         cb.record_failure()
         assert cb.state is State.CLOSED
 
-    def test_open_to_half_open_after_timeout(self):
+    def test_open_to_half_open_after_timeout(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
         assert cb.state is State.OPEN
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
 
-    def test_half_open_to_closed_on_success(self):
+    def test_half_open_to_closed_on_success(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
         cb.record_success()
         assert cb.state is State.CLOSED
 
-    def test_half_open_to_open_on_failure(self):
+    def test_half_open_to_open_on_failure(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
         cb.record_failure()
         assert cb.state is State.OPEN
@@ -92,10 +111,10 @@ class TestReset:
         assert cb.state is State.CLOSED
         assert cb.failures == 0
 
-    def test_reset_from_half_open(self):
+    def test_reset_from_half_open(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
         cb.reset()
         assert cb.state is State.CLOSED
@@ -104,14 +123,6 @@ class TestReset:
 class TestStatistics:
     """Verify statistics tracking (MeshForge pattern)."""
 
-    def test_initial_stats(self):
-        cb = CircuitBreaker(name="test")
-        stats = cb.get_stats()
-        assert stats["name"] == "test"
-        assert stats["total_successes"] == 0
-        assert stats["total_failures"] == 0
-        assert stats["total_trips"] == 0
-
     def test_stats_track_successes(self):
         cb = CircuitBreaker()
         cb.record_success()
@@ -134,10 +145,10 @@ class TestStatistics:
         stats = cb.get_stats()
         assert stats["total_trips"] == 1
 
-    def test_half_open_success_tracked(self):
+    def test_half_open_success_tracked(self, fake_clock):
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
         cb.record_failure()
-        time.sleep(0.02)
+        fake_clock[0] += 0.02
         assert cb.state is State.HALF_OPEN
         cb.record_success()
         stats = cb.get_stats()
@@ -206,24 +217,29 @@ class TestCircuitProtectedDecorator:
 
 
 class TestThreadSafety:
-    def test_concurrent_failures(self):
+    @pytest.mark.parametrize("per_thread,n_threads", [
+        pytest.param(20, 4, id="quick"),
+        pytest.param(50, 4, id="stress", marks=pytest.mark.slow),
+    ])
+    def test_concurrent_failures(self, per_thread, n_threads):
         """Multiple threads recording failures should not corrupt state."""
-        cb = CircuitBreaker(failure_threshold=100)
+        total = per_thread * n_threads
+        cb = CircuitBreaker(failure_threshold=total // 2)
         errors = []
 
         def fail_many():
             try:
-                for _ in range(50):
+                for _ in range(per_thread):
                     cb.record_failure()
             except Exception as e:
                 errors.append(e)
 
-        threads = [threading.Thread(target=fail_many) for _ in range(4)]
+        threads = [threading.Thread(target=fail_many) for _ in range(n_threads)]
         for t in threads:
             t.start()
         for t in threads:
             t.join()
 
         assert not errors
-        assert cb.failures == 200
+        assert cb.failures == total
         assert cb.state is State.OPEN
@@ -2,209 +2,163 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
+from src.utils import common
 from src.utils.common import (
     validate_hostname, validate_port, validate_config,
     validate_message_length, get_real_user_home, check_config_permissions,
     validate_config_strict, ConfigValidationError,
-    config_template_serial, config_template_tcp,
+    config_template_serial, config_template_tcp, load_config,
 )
 
 
-class TestValidateHostname:
-    def test_valid_localhost(self):
-        ok, _ = validate_hostname("localhost")
-        assert ok
-
-    def test_valid_ip(self):
-        ok, _ = validate_hostname("192.168.1.1")
-        assert ok
-
-    def test_valid_ipv6_colon(self):
-        ok, _ = validate_hostname("::1")
-        assert ok
+# Current user as the sudo user for testing; one NSS lookup per session.
+_CURRENT_USER = os.environ.get('USER', 'root')
+try:
+    import pwd
+    _EXPECTED_HOME = pwd.getpwnam(_CURRENT_USER).pw_dir
+except (KeyError, ImportError):
+    _EXPECTED_HOME = None
 
-    def test_flag_injection_rejected(self):
-        ok, err = validate_hostname("-evil")
-        assert not ok
-        assert "flag injection" in err
 
-    def test_too_long_rejected(self):
-        ok, _ = validate_hostname("a" * 254)
-        assert not ok
+def _has_warning(warnings, needle):
+    """Case-insensitive: does any warning mention *needle*?"""
+    needle = needle.lower()
+    return any(needle in w.lower() for w in warnings)
 
-    def test_exactly_253_ok(self):
-        ok, _ = validate_hostname("a" * 253)
-        assert ok
 
-    def test_invalid_chars_rejected(self):
-        ok, _ = validate_hostname("host; rm -rf /")
-        assert not ok
-
-    def test_empty_rejected(self):
-        ok, _ = validate_hostname("")
-        assert not ok
-
-    def test_none_rejected(self):
-        ok, _ = validate_hostname(None)
-        assert not ok
-
-    def test_int_rejected(self):
-        ok, _ = validate_hostname(123)
-        assert not ok
+class TestValidateHostname:
+    @pytest.mark.parametrize("host, expected, err_fragment", [
+        ("localhost", True, ""),
+        ("192.168.1.1", True, ""),
+        ("::1", True, ""),
+        ("a" * 253, True, ""),
+        ("-evil", False, "flag injection"),
+        ("a" * 254, False, "253"),
+        ("host; rm -rf /", False, "invalid characters"),
+        ("", False, "non-empty"),
+        (None, False, "non-empty"),
+        (123, False, "non-empty"),
+    ], ids=[
+        "localhost", "ipv4", "ipv6_loopback", "exactly_253", "flag_injection",
+        "too_long", "invalid_chars", "empty", "none", "int",
+    ])
+    def test_hostname(self, host, expected, err_fragment):
+        ok, err = validate_hostname(host)
+        assert ok is expected
+        assert err_fragment in err
+
+    def test_common_hosts_pass_full_validation(self):
+        """The fast-path set must never admit something the regex would reject."""
+        for host in common._COMMON_HOSTS:
+            assert common._HOSTNAME_RE.match(host)
+            assert not host.startswith('-')
+            assert validate_hostname(host) == (True, "")
 
 
 class TestValidatePort:
-    def test_valid_port(self):
-        ok, _ = validate_port(5000)
-        assert ok
-
-    def test_port_1(self):
-        ok, _ = validate_port(1)
-        assert ok
-
-    def test_port_65535(self):
-        ok, _ = validate_port(65535)
-        assert ok
-
-    def test_zero_rejected(self):
-        ok, _ = validate_port(0)
-        assert not ok
-
-    def test_negative_rejected(self):
-        ok, _ = validate_port(-1)
-        assert not ok
-
-    def test_too_high_rejected(self):
-        ok, _ = validate_port(70000)
-        assert not ok
-
-    def test_string_rejected(self):
-        ok, _ = validate_port("5000")
-        assert not ok
-
-    def test_bool_rejected(self):
-        ok, _ = validate_port(True)
-        assert not ok
-
-    def test_float_rejected(self):
-        ok, _ = validate_port(5000.0)
-        assert not ok
+    @pytest.mark.parametrize("port, expected", [
+        (5000, True),
+        (1, True),
+        (65535, True),
+        (0, False),
+        (-1, False),
+        (70000, False),
+        ("5000", False),
+        (True, False),
+        (5000.0, False),
+    ], ids=[
+        "typical", "lowest", "highest", "zero", "negative", "too_high",
+        "string", "bool", "float",
+    ])
+    def test_port(self, port, expected):
+        ok, _ = validate_port(port)
+        assert ok is expected
 
 
 class TestValidateConfig:
-    def test_valid_serial_config(self):
-        cfg = {"gateway": {"connection_type": "serial", "bitrate": 500}}
-        assert validate_config(cfg) == []
-
-    def test_valid_tcp_config(self):
-        cfg = {"gateway": {"connection_type": "tcp", "host": "localhost", "tcp_port": 4403}}
+    @pytest.mark.parametrize("cfg", [
+        {"gateway": {"connection_type": "serial", "bitrate": 500}},
+        {"gateway": {"connection_type": "tcp", "host": "localhost", "tcp_port": 4403}},
+        {},
+    ], ids=["serial", "tcp", "empty"])
+    def test_valid_config(self, cfg):
         assert validate_config(cfg) == []
 
-    def test_invalid_connection_type(self):
-        cfg = {"gateway": {"connection_type": "bluetooth"}}
-        warnings = validate_config(cfg)
-        assert len(warnings) >= 1
-        assert any("connection_type" in w for w in warnings)
-
-    def test_invalid_host_flag_injection(self):
-        cfg = {"gateway": {"host": "-evil"}}
-        warnings = validate_config(cfg)
-        assert any("host" in w.lower() for w in warnings)
-
-    def test_invalid_tcp_port_string(self):
-        cfg = {"gateway": {"tcp_port": "not_a_number"}}
-        warnings = validate_config(cfg)
-        assert len(warnings) >= 1
-
-    def test_invalid_tcp_port_out_of_range(self):
-        cfg = {"gateway": {"tcp_port": 99999}}
-        warnings = validate_config(cfg)
-        assert len(warnings) >= 1
-
-    def test_invalid_bitrate(self):
-        cfg = {"gateway": {"bitrate": -10}}
+    @pytest.mark.parametrize("cfg, fragment", [
+        ({"gateway": {"connection_type": "bluetooth"}}, "connection_type"),
+        ({"gateway": {"host": "-evil"}}, "host"),
+        ({"gateway": {"tcp_port": "not_a_number"}}, "tcp_port"),
+        ({"gateway": {"tcp_port": 99999}}, "tcp_port"),
+        ({"gateway": {"bitrate": -10}}, "bitrate"),
+        ({"dashboard": {"port": 0}}, "dashboard"),
+        ({"dashboard": {"host": "evil; cmd"}}, "dashboard.host"),
+    ], ids=[
+        "connection_type", "host_flag_injection", "tcp_port_string",
+        "tcp_port_out_of_range", "bitrate", "dashboard_port", "dashboard_host",
+    ])
+    def test_invalid_config_warns(self, cfg, fragment):
         warnings = validate_config(cfg)
-        assert any("bitrate" in w for w in warnings)
-
-    def test_invalid_dashboard_port(self):
-        cfg = {"dashboard": {"port": 0}}
-        warnings = validate_config(cfg)
-        assert len(warnings) >= 1
-
-    def test_invalid_dashboard_host(self):
-        cfg = {"dashboard": {"host": "evil; cmd"}}
-        warnings = validate_config(cfg)
-        assert any("dashboard.host" in w for w in warnings)
+        assert _has_warning(warnings, fragment), warnings
 
     def test_not_dict(self):
         assert validate_config("not a dict") == ["Config is not a JSON object"]
 
-    def test_empty_dict_is_valid(self):
-        assert validate_config({}) == []
-
 
 class TestLoadConfig:
     def test_load_valid_config(self, tmp_config):
-        with patch('src.utils.common.CONFIG_PATH', tmp_config):
-            from src.utils.common import load_config
+        with patch.object(common, 'CONFIG_PATH', tmp_config):
             cfg = load_config()
             assert cfg['gateway']['name'] == 'TestNode'
             assert cfg['gateway']['connection_type'] == 'serial'
 
+    def test_load_config_variant(self, make_config):
+        path = make_config(gateway={"connection_type": "tcp", "host": "10.0.0.5"})
+        with patch.object(common, 'CONFIG_PATH', path):
+            cfg = load_config()
+        assert cfg['gateway']['connection_type'] == 'tcp'
+        assert cfg['gateway']['host'] == '10.0.0.5'
+        assert cfg['gateway']['name'] == 'TestNode'
+
     def test_missing_config_returns_default_fallback(self, tmp_path):
         missing = str(tmp_path / "nonexistent.json")
-        with patch('src.utils.common.CONFIG_PATH', missing):
-            from src.utils.common import load_config
+        with patch.object(common, 'CONFIG_PATH', missing):
             assert load_config() == {}
 
     def test_invalid_json_returns_fallback(self, bad_config):
-        with patch('src.utils.common.CONFIG_PATH', bad_config):
-            from src.utils.common import load_config
+        with patch.object(common, 'CONFIG_PATH', bad_config):
             assert load_config() == {}
 
     def test_custom_fallback(self, tmp_path):
         missing = str(tmp_path / "nonexistent.json")
-        with patch('src.utils.common.CONFIG_PATH', missing):
-            from src.utils.common import load_config
+        with patch.object(common, 'CONFIG_PATH', missing):
             assert load_config(fallback=None) is None
 
     def test_custom_dict_fallback(self, tmp_path):
         missing = str(tmp_path / "nonexistent.json")
         sentinel = {"gateway": {"name": "Fallback"}}
-        with patch('src.utils.common.CONFIG_PATH', missing):
-            from src.utils.common import load_config
+        with patch.object(common, 'CONFIG_PATH', missing):
             result = load_config(fallback=sentinel)
             assert result['gateway']['name'] == 'Fallback'
 
 
 class TestValidateMessageLength:
-    def test_within_limit(self):
-        ok, msg = validate_message_length(b'\x00' * 100)
-        assert ok is True
-        assert "100 bytes OK" in msg
-
-    def test_exactly_at_limit(self):
-        ok, msg = validate_message_length(b'\x00' * 228)
-        assert ok is True
-
-    def test_exceeds_limit(self):
-        ok, msg = validate_message_length(b'\x00' * 300)
-        assert ok is False
-        assert "exceeds" in msg
-
-    def test_empty_data(self):
-        ok, msg = validate_message_length(b'')
-        assert ok is True
-        assert "0 bytes OK" in msg
-
-    def test_custom_limit(self):
-        ok, msg = validate_message_length(b'\x00' * 50, max_bytes=10)
-        assert ok is False
-
-    def test_non_bytes_rejected(self):
-        ok, msg = validate_message_length("not bytes")
-        assert ok is False
-        assert "must be bytes" in msg
+    @pytest.mark.parametrize("data, kwargs, expected, msg_fragment", [
+        (b'\x00' * 100, {}, True, "100 bytes OK"),
+        (b'\x00' * 228, {}, True, "228 bytes OK"),
+        (b'\x00' * 300, {}, False, "exceeds"),
+        (b'', {}, True, "0 bytes OK"),
+        (b'\x00' * 50, {"max_bytes": 10}, False, "exceeds"),
+        ("not bytes", {}, False, "must be bytes"),
+    ], ids=[
+        "within_limit", "exactly_at_limit", "exceeds_limit", "empty",
+        "custom_limit", "non_bytes",
+    ])
+    def test_message_length(self, data, kwargs, expected, msg_fragment):
+        ok, msg = validate_message_length(data, **kwargs)
+        assert ok is expected
+        assert msg_fragment in msg
 
 
 class TestGetRealUserHome:
@@ -213,90 +167,63 @@ class TestGetRealUserHome:
         assert isinstance(home, str)
         assert len(home) > 0
 
-    def test_uses_sudo_user_when_set(self):
+    @pytest.mark.skipif(_EXPECTED_HOME is None, reason="pwd lookup unavailable")
+    def test_uses_sudo_user_when_set(self, monkeypatch):
         """When SUDO_USER is set, should resolve that user's home."""
-        import pwd
-        # Use current user as the sudo user for testing
-        current_user = os.environ.get('USER', 'root')
-        try:
-            expected_home = pwd.getpwnam(current_user).pw_dir
-        except (KeyError, ImportError):
-            return  # Skip on systems where pwd lookup fails
-
-        with patch.dict(os.environ, {'SUDO_USER': current_user}):
-            home = get_real_user_home()
-            assert home == expected_home
-
-    def test_falls_back_without_sudo_user(self):
+        monkeypatch.setenv('SUDO_USER', _CURRENT_USER)
+        assert get_real_user_home() == _EXPECTED_HOME
+
+    def test_falls_back_without_sudo_user(self, monkeypatch):
         """Without SUDO_USER, should use os.path.expanduser."""
-        env = dict(os.environ)
-        env.pop('SUDO_USER', None)
-        with patch.dict(os.environ, env, clear=True):
-            home = get_real_user_home()
-            assert home == os.path.expanduser("~")
+        monkeypatch.delenv('SUDO_USER', raising=False)
+        assert get_real_user_home() == os.path.expanduser("~")
 
 
 class TestCheckConfigPermissions:
-    def test_world_readable_warned(self, tmp_path):
-        """World-readable config should produce a warning."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text("{}")
-        config_file.chmod(0o644)  # world-readable
-
-        if os.name != 'posix':
-            return  # Only meaningful on POSIX
-
-        warnings = check_config_permissions(str(config_file))
-        assert any("world-readable" in w for w in warnings)
-
-    def test_secure_permissions_no_warning(self, tmp_path):
-        """Config with 600 perms should produce no warnings."""
-        config_file = tmp_path / "config.json"
+    @pytest.fixture(scope="class")
+    def shared_config(self, tmp_path_factory):
+        """One config file per class; each test sets the mode it needs."""
+        config_file = tmp_path_factory.mktemp("perm") / "config.json"
         config_file.write_text("{}")
-        config_file.chmod(0o600)
-
-        if os.name != 'posix':
-            return
-
-        warnings = check_config_permissions(str(config_file))
-        assert len(warnings) == 0
-
-    def test_nonexistent_file_no_warning(self, tmp_path):
+        return config_file
+
+    @pytest.mark.skipif(os.name != 'posix', reason="POSIX permissions only")
+    @pytest.mark.parametrize("mode, expect_warning", [
+        (0o644, True),
+        (0o600, False),
+    ], ids=["world_readable", "owner_only"])
+    def test_permission_mode(self, shared_config, mode, expect_warning):
+        shared_config.chmod(mode)
+        warnings = check_config_permissions(str(shared_config))
+        assert _has_warning(warnings, "world-readable") is expect_warning
+        if not expect_warning:
+            assert warnings == []
+
+    def test_nonexistent_file_no_warning(self, shared_config):
         """Missing config file should not raise or warn."""
-        warnings = check_config_permissions(str(tmp_path / "missing.json"))
+        warnings = check_config_permissions(str(shared_config.with_name("missing.json")))
         assert len(warnings) == 0
 
 
 class TestValidateConfigExtended:
     """Additional config validation edge cases."""
 
-    def test_empty_features_is_valid(self):
-        cfg = {"features": {}}
+    @pytest.mark.parametrize("cfg", [
+        {"features": {}},
+        {"features": {"circuit_breaker": True, "tx_queue": False}},
+    ], ids=["empty_features", "features_with_values"])
+    def test_valid(self, cfg):
         assert validate_config(cfg) == []
 
-    def test_features_with_values_is_valid(self):
-        cfg = {"features": {"circuit_breaker": True, "tx_queue": False}}
-        assert validate_config(cfg) == []
-
-    def test_bitrate_zero_rejected(self):
-        cfg = {"gateway": {"bitrate": 0}}
-        warnings = validate_config(cfg)
-        assert any("bitrate" in w for w in warnings)
-
-    def test_bitrate_string_rejected(self):
-        cfg = {"gateway": {"bitrate": "fast"}}
-        warnings = validate_config(cfg)
-        assert any("bitrate" in w for w in warnings)
-
-    def test_dashboard_host_invalid(self):
-        cfg = {"dashboard": {"host": "-evil"}}
-        warnings = validate_config(cfg)
-        assert any("dashboard.host" in w for w in warnings)
-
-    def test_gateway_section_not_dict(self):
-        cfg = {"gateway": "not a dict"}
+    @pytest.mark.parametrize("cfg, fragment", [
+        ({"gateway": {"bitrate": 0}}, "bitrate"),
+        ({"gateway": {"bitrate": "fast"}}, "bitrate"),
+        ({"dashboard": {"host": "-evil"}}, "dashboard.host"),
+        ({"gateway": "not a dict"}, "gateway section"),
+    ], ids=["bitrate_zero", "bitrate_string", "dashboard_host", "gateway_not_dict"])
+    def test_rejected(self, cfg, fragment):
         warnings = validate_config(cfg)
-        assert any("gateway section" in w for w in warnings)
+        assert _has_warning(warnings, fragment), warnings
 
 
 class TestValidateConfigStrict:
@@ -1,22 +1,24 @@
 """Tests for src/ui/dashboard.py — system resource helpers."""
-import os
-import sys
-from unittest.mock import patch, mock_open
+import io
+from unittest.mock import patch
 
-import pytest
+from src.ui.dashboard import _get_uptime, _get_memory, _get_disk
 
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
 
-from src.ui.dashboard import _get_uptime, _get_memory, _get_disk
+def _fake_open(data):
+    """``open`` replacement yielding an in-memory file of *data*.
+
+    StringIO/BytesIO are C-implemented and already context managers,
+    so this avoids mock_open's MagicMock wrapping of every read call.
+    """
+    file_type = io.BytesIO if isinstance(data, bytes) else io.StringIO
+    return lambda *args, **kwargs: file_type(data)
 
 
 class TestGetUptime:
     def test_returns_string_on_linux(self):
         """On Linux, _get_uptime should return a formatted string."""
-        with patch("os.path.isfile", return_value=True), \
-             patch("builtins.open", mock_open(read_data="86523.45 172000.12\n")):
+        with patch("builtins.open", side_effect=_fake_open("86523.45 172000.12\n")):
             result = _get_uptime()
         assert result is not None
         assert isinstance(result, str)
@@ -25,47 +27,58 @@ class TestGetUptime:
     def test_formats_days_hours_minutes(self):
         """Should format 1d 0h 2m correctly."""
         # 86520 seconds = 1d 0h 2m
-        with patch("os.path.isfile", return_value=True), \
-             patch("builtins.open", mock_open(read_data="86520.0 0\n")):
+        with patch("builtins.open", side_effect=_fake_open("86520.0 0\n")):
             result = _get_uptime()
         assert "1d" in result
         assert "2m" in result
 
     def test_returns_none_when_no_proc(self):
         """Should return None when /proc/uptime doesn't exist."""
-        with patch("os.path.isfile", return_value=False):
+        with patch("builtins.open", side_effect=FileNotFoundError):
             result = _get_uptime()
         assert result is None
 
     def test_handles_oserror(self):
         """Should return None on OSError."""
-        with patch("os.path.isfile", return_value=True), \
-             patch("builtins.open", side_effect=OSError):
+        with patch("builtins.open", side_effect=OSError):
             result = _get_uptime()
         assert result is None
 
+    def test_does_not_stat_before_open(self):
+        """One open() per probe — no separate isfile() stat."""
+        with patch("os.path.isfile") as mock_isfile, \
+             patch("builtins.open", side_effect=_fake_open("60.0 0\n")):
+            _get_uptime()
+        mock_isfile.assert_not_called()
+
 
 class TestGetMemory:
     MEMINFO = (
-        "MemTotal:        8000000 kB\n"
-        "MemFree:         2000000 kB\n"
-        "MemAvailable:    4000000 kB\n"
-        "Buffers:          500000 kB\n"
+        b"MemTotal:        8000000 kB\n"
+        b"MemFree:         2000000 kB\n"
+        b"MemAvailable:    4000000 kB\n"
+        b"Buffers:          500000 kB\n"
     )
 
     def test_returns_tuple_on_linux(self):
         """On Linux, _get_memory should return (used_mb, total_mb)."""
-        with patch("os.path.isfile", return_value=True), \
-             patch("builtins.open", mock_open(read_data=self.MEMINFO)):
+        with patch("builtins.open", side_effect=_fake_open(self.MEMINFO)):
             result = _get_memory()
         assert result is not None
         used_mb, total_mb = result
-        assert total_mb == pytest.approx(8000000 / 1024, rel=0.01)
-        assert used_mb == pytest.approx((8000000 - 4000000) / 1024, rel=0.01)
+        # kB / 1024 with these inputs is exact in binary floating point
+        assert total_mb == 8000000 / 1024 == 7812.5
+        assert used_mb == (8000000 - 4000000) / 1024 == 3906.25
+
+    def test_missing_memavailable_counts_all_used(self):
+        """Older kernels without MemAvailable still report a total."""
+        with patch("builtins.open", side_effect=_fake_open(b"MemTotal: 1024 kB\n")):
+            result = _get_memory()
+        assert result == (1.0, 1.0)
 
     def test_returns_none_when_no_proc(self):
         """Should return None when /proc/meminfo doesn't exist."""
-        with patch("os.path.isfile", return_value=False):
+        with patch("builtins.open", side_effect=FileNotFoundError):
             result = _get_memory()
         assert result is None
 
@@ -1,13 +1,18 @@
 """Tests for src.utils.health_probe – ActiveHealthProbe hysteresis and lifecycle."""
+import json
 import os
+import subprocess
 import threading
 import time
+from unittest.mock import MagicMock, patch
+
 import pytest
 from src.utils.health_probe import (
     ActiveHealthProbe,
     HealthResult,
     HealthState,
     get_health_probe,
+    load_snapshot,
 )
 import src.utils.health_probe as _hp_mod
 
@@ -24,12 +29,32 @@ def _boom_check():
     raise RuntimeError("boom")
 
 
+@pytest.fixture
+def make_probe():
+    """Factory for probes, optionally with *check* registered as "svc".
+
+    Every probe is stopped at teardown, so a test that fails after
+    ``start()`` does not leak its background thread.
+    """
+    probes = []
+
+    def _make(check=None, **kwargs):
+        probe = ActiveHealthProbe(**kwargs)
+        if check is not None:
+            probe.register_check("svc", check)
+        probes.append(probe)
+        return probe
+
+    yield _make
+    for probe in probes:
+        probe.stop(timeout=2)
+
+
 class TestHysteresis:
     """Verify that hysteresis prevents false positives."""
 
-    def test_stays_unknown_until_enough_passes(self):
-        probe = ActiveHealthProbe(fails=3, passes=2)
-        probe.register_check("svc", _healthy_check)
+    def test_stays_unknown_until_enough_passes(self, make_probe):
+        probe = make_probe(_healthy_check, fails=3, passes=2)
 
         # First pass → still UNKNOWN (need 2)
         probe.check_now("svc")
@@ -39,9 +64,8 @@ class TestHysteresis:
         probe.check_now("svc")
         assert probe.is_healthy("svc")
 
-    def test_stays_healthy_on_single_failure(self):
-        probe = ActiveHealthProbe(fails=3, passes=2)
-        probe.register_check("svc", _healthy_check)
+    def test_stays_healthy_on_single_failure(self, make_probe):
+        probe = make_probe(_healthy_check, fails=3, passes=2)
         probe.check_now("svc")
         probe.check_now("svc")
         assert probe.is_healthy("svc")
@@ -52,9 +76,8 @@ class TestHysteresis:
         # Still healthy — only 1 fail, need 3
         assert probe.is_healthy("svc")
 
-    def test_unhealthy_after_threshold_failures(self):
-        probe = ActiveHealthProbe(fails=3, passes=2)
-        probe.register_check("svc", _healthy_check)
+    def test_unhealthy_after_threshold_failures(self, make_probe):
+        probe = make_probe(_healthy_check, fails=3, passes=2)
         probe.check_now("svc")
         probe.check_now("svc")
         assert probe.is_healthy("svc")
@@ -68,9 +91,8 @@ class TestHysteresis:
         status = probe.get_status("svc")
         assert status["state"] == "unhealthy"
 
-    def test_recovering_then_healthy(self):
-        probe = ActiveHealthProbe(fails=2, passes=2)
-        probe.register_check("svc", _unhealthy_check)
+    def test_recovering_then_healthy(self, make_probe):
+        probe = make_probe(_unhealthy_check, fails=2, passes=2)
 
         # Drive to UNHEALTHY
         probe.check_now("svc")
@@ -87,9 +109,8 @@ class TestHysteresis:
         probe.check_now("svc")
         assert probe.is_healthy("svc")
 
-    def test_recovery_interrupted_by_failure(self):
-        probe = ActiveHealthProbe(fails=2, passes=3)
-        probe.register_check("svc", _unhealthy_check)
+    def test_recovery_interrupted_by_failure(self, make_probe):
+        probe = make_probe(_unhealthy_check, fails=2, passes=3)
 
         # Drive to UNHEALTHY
         probe.check_now("svc")
@@ -109,20 +130,18 @@ class TestHysteresis:
 
 
 class TestCallbacks:
-    def test_state_change_callback_fires(self):
+    def test_state_change_callback_fires(self, make_probe):
         events = []
-        probe = ActiveHealthProbe(fails=1, passes=1)
-        probe.register_check("svc", _healthy_check)
+        probe = make_probe(_healthy_check, fails=1, passes=1)
         probe.register_callback("on_state_change",
                                 lambda name, state: events.append((name, state)))
         probe.check_now("svc")
         assert len(events) == 1
         assert events[0] == ("svc", HealthState.HEALTHY)
 
-    def test_unhealthy_callback_fires(self):
+    def test_unhealthy_callback_fires(self, make_probe):
         events = []
-        probe = ActiveHealthProbe(fails=1, passes=1)
-        probe.register_check("svc", _unhealthy_check)
+        probe = make_probe(_unhealthy_check, fails=1, passes=1)
         probe.register_callback("on_unhealthy",
                                 lambda name, state: events.append(name))
         probe.check_now("svc")
@@ -130,31 +149,36 @@ class TestCallbacks:
 
 
 class TestCheckExceptionHandling:
-    def test_exception_counts_as_failure(self):
-        probe = ActiveHealthProbe(fails=1, passes=1)
-        probe.register_check("svc", _boom_check)
+    def test_exception_counts_as_failure(self, make_probe):
+        probe = make_probe(_boom_check, fails=1, passes=1)
         result = probe.check_now("svc")
         assert not result.healthy
         assert "boom" in result.reason
 
 
 class TestStartStop:
-    def test_start_stop_lifecycle(self):
-        probe = ActiveHealthProbe(interval=1, fails=1, passes=1)
-        probe.register_check("svc", _healthy_check)
+    def test_start_stop_lifecycle(self, make_probe):
+        ran = threading.Event()
+
+        def check():
+            ran.set()
+            return HealthResult(healthy=True, reason="ok")
+
+        probe = make_probe(check, interval=1, fails=1, passes=1)
         probe.start()
-        time.sleep(0.2)
+        assert ran.wait(timeout=2.0)
         probe.stop(timeout=2)
-        # Should have run at least one check
+        assert not probe._thread.is_alive()
+        # stop() joined the thread, so the first result is recorded
         status = probe.get_status("svc")
         assert status["total_checks"] >= 1
 
-    def test_double_start_is_safe(self):
-        probe = ActiveHealthProbe(interval=60, fails=1, passes=1)
-        probe.register_check("svc", _healthy_check)
+    def test_double_start_is_safe(self, make_probe):
+        probe = make_probe(_healthy_check, interval=60, fails=1, passes=1)
         probe.start()
-        probe.start()  # should not crash
-        probe.stop(timeout=2)
+        first = probe._thread
+        probe.start()  # should not crash or spawn a second thread
+        assert probe._thread is first
 
 
 class TestAnomalyDetection:
@@ -206,8 +230,8 @@ class TestAnomalyDetection:
 
 
 class TestGetAllStatus:
-    def test_returns_all_services(self):
-        probe = ActiveHealthProbe(fails=1, passes=1)
+    def test_returns_all_services(self, make_probe):
+        probe = make_probe(fails=1, passes=1)
         probe.register_check("a", _healthy_check)
         probe.register_check("b", _unhealthy_check)
         probe.check_now("a")
@@ -216,12 +240,12 @@ class TestGetAllStatus:
         assert "a" in all_status
         assert "b" in all_status
 
-    def test_unregistered_service_returns_none(self):
-        probe = ActiveHealthProbe(fails=1, passes=1)
+    def test_unregistered_service_returns_none(self, make_probe):
+        probe = make_probe(fails=1, passes=1)
         assert probe.get_status("nope") is None
 
-    def test_unregistered_is_not_healthy(self):
-        probe = ActiveHealthProbe(fails=1, passes=1)
+    def test_unregistered_is_not_healthy(self, make_probe):
+        probe = make_probe(fails=1, passes=1)
         assert not probe.is_healthy("nope")
 
 
@@ -263,7 +287,6 @@ class TestSnapshotPersistence:
 
         probe.save_snapshot(path)
 
-        from src.utils.health_probe import load_snapshot
         data = load_snapshot(path, max_age=60.0)
         assert data is not None
         assert "updated_at" in data
@@ -273,39 +296,32 @@ class TestSnapshotPersistence:
         assert svc["anomaly_count"] == 1
 
     def test_load_missing_file_returns_none(self, tmp_path):
-        from src.utils.health_probe import load_snapshot
         assert load_snapshot(str(tmp_path / "nope.json")) is None
 
     def test_load_malformed_json_returns_none(self, tmp_path):
         path = tmp_path / "health.json"
         path.write_text("{ not json")
-        from src.utils.health_probe import load_snapshot
         assert load_snapshot(str(path)) is None
 
     def test_load_missing_updated_at_returns_none(self, tmp_path):
         path = tmp_path / "health.json"
         path.write_text('{"services": {}}')
-        from src.utils.health_probe import load_snapshot
         assert load_snapshot(str(path)) is None
 
     def test_load_stale_snapshot_returns_none(self, tmp_path):
-        import json as _json
         path = tmp_path / "health.json"
-        path.write_text(_json.dumps({
+        path.write_text(json.dumps({
             "updated_at": time.time() - 3600,
             "services": {},
         }))
-        from src.utils.health_probe import load_snapshot
         assert load_snapshot(str(path), max_age=60.0) is None
 
     def test_load_max_age_zero_disables_ttl(self, tmp_path):
-        import json as _json
         path = tmp_path / "health.json"
-        path.write_text(_json.dumps({
+        path.write_text(json.dumps({
             "updated_at": 0.0,
             "services": {"x": {"state": "healthy"}},
         }))
-        from src.utils.health_probe import load_snapshot
         data = load_snapshot(str(path), max_age=0)
         assert data is not None
         assert data["services"]["x"]["state"] == "healthy"
@@ -327,3 +343,44 @@ class TestSnapshotPersistence:
         # Should not leave *.tmp behind
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert tmp_files == []
+
+
+class TestCheckSystemdService:
+    """check_systemd_service reads systemctl output as raw bytes."""
+
+    def _popen(self, stdout=b"", side_effect=None):
+        proc = MagicMock()
+        proc.__enter__.return_value = proc
+        proc.communicate.side_effect = side_effect
+        if side_effect is None:
+            proc.communicate.return_value = (stdout, None)
+        return proc
+
+    def test_active(self):
+        proc = self._popen(b"active\n")
+        with patch.object(_hp_mod.subprocess, "Popen", return_value=proc) as popen:
+            result = ActiveHealthProbe().check_systemd_service("meshtasticd")
+        assert result.healthy is True
+        assert result.reason == "active"
+        assert popen.call_args.kwargs["stderr"] == subprocess.DEVNULL
+
+    def test_inactive(self):
+        proc = self._popen(b"inactive\n")
+        with patch.object(_hp_mod.subprocess, "Popen", return_value=proc):
+            result = ActiveHealthProbe().check_systemd_service("meshtasticd")
+        assert result.healthy is False
+        assert result.reason == "status_inactive"
+
+    def test_timeout_kills_process(self):
+        proc = self._popen(side_effect=[
+            subprocess.TimeoutExpired("systemctl", 5), (b"", None),
+        ])
+        with patch.object(_hp_mod.subprocess, "Popen", return_value=proc):
+            result = ActiveHealthProbe().check_systemd_service("meshtasticd")
+        assert result.reason == "timeout"
+        proc.kill.assert_called_once()
+
+    def test_systemctl_missing(self):
+        with patch.object(_hp_mod.subprocess, "Popen", side_effect=FileNotFoundError):
+            result = ActiveHealthProbe().check_systemd_service("meshtasticd")
+        assert result.reason == "systemctl_not_found"
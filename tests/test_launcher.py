@@ -1,16 +1,17 @@
 """Tests for launcher.py — gateway startup, reconnect, and signal handling."""
 import signal
 import sys
-import os
 import threading
+import types
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Ensure project root on path
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+
+# Modules that must be re-imported under the mocks.  The driver is
+# reachable both as a top-level module (launcher puts src/ on sys.path)
+# and as a package member.
+_CACHED_MODULES = ('launcher', 'Meshtastic_Interface', 'src.Meshtastic_Interface')
 
 
 def _import_launcher():
@@ -20,24 +21,15 @@ def _import_launcher():
     which also import RNS and meshtastic. We must mock them before import.
     """
     # Clear any previously cached import
-    for key in list(sys.modules):
-        if key in ('launcher', 'Meshtastic_Interface') or 'Meshtastic_Interface' in key:
-            del sys.modules[key]
-
-    # Reset the module-level health-probe singleton so each test gets a fresh
-    # probe (tests rely on per-call hysteresis counters).
-    try:
-        import src.utils.health_probe as _hp_mod
-        _hp_mod._health_probe = None
-    except ImportError:
-        pass
+    for name in _CACHED_MODULES:
+        sys.modules.pop(name, None)
 
     mock_rns = MagicMock()
-    mock_rns_interfaces = MagicMock()
-    mock_rns_interface_mod = MagicMock()
+    mock_rns_interface_mod = types.ModuleType('RNS.Interfaces.Interface')
     mock_rns_interface_mod.Interface = type('Interface', (), {'MODE_ACCESS_POINT': 1})
+    mock_rns_interfaces = types.ModuleType('RNS.Interfaces')
+    mock_rns_interfaces.Interface = mock_rns_interface_mod
     mock_rns.Interfaces = mock_rns_interfaces
-    mock_rns.Interfaces.Interface = mock_rns_interface_mod
 
     mock_mesh = MagicMock()
     mock_serial = MagicMock()
@@ -59,18 +51,60 @@ def _import_launcher():
 
     with patch.dict('sys.modules', mocks):
         import launcher
-        return launcher, mock_rns
+        # patch.dict drops modules first imported inside the block on exit,
+        # so grab the health_probe copy launcher is actually bound to.
+        import src.utils.health_probe as health_probe_mod
+        return launcher, mock_rns, health_probe_mod
+
+
+class _FakeInterface:
+    """Stand-in for the mesh driver with just what start_gateway touches."""
+
+    def __init__(self, online=True, healthy=True):
+        self.name = "TestRadio"
+        self.online = online
+        self.interface = object()
+        self.metrics = {"online": online, "tx_packets": 0, "rx_packets": 0}
+        self.healthy = healthy
+        self.detach_count = 0
+
+    def health_check(self):
+        return self.healthy
+
+    def reconnect(self):
+        return False
+
+    def detach(self):
+        self.detach_count += 1
+
+
+@pytest.fixture(scope="module")
+def _launcher_import():
+    """Import launcher once for this file; the import is the expensive part."""
+    return _import_launcher()
+
+
+@pytest.fixture
+def launcher_env(_launcher_import):
+    """Return ``(launcher, mock_rns)`` with per-test state reset.
+
+    Tests only swap launcher attributes via ``patch.object``, so the
+    module itself can be shared; the RNS mock's call history and the
+    health-probe singleton (tests rely on per-call hysteresis counters)
+    are reset for each test.
+    """
+    launcher, mock_rns, health_probe_mod = _launcher_import
+    mock_rns.reset_mock()
+    health_probe_mod._health_probe = None
+    return launcher, mock_rns
 
 
 class TestStartGateway:
-    def test_start_gateway_calls_reticulum_with_configdir(self):
+    def test_start_gateway_calls_reticulum_with_configdir(self, launcher_env):
         """start_gateway should pass configdir= to RNS.Reticulum()."""
-        launcher, mock_rns = _import_launcher()
+        launcher, mock_rns = launcher_env
 
-        mock_interface = MagicMock()
-        mock_interface.online = True
-        mock_interface.interface = MagicMock()
-        mock_interface.name = "TestRadio"
+        mock_interface = _FakeInterface()
 
         with patch.object(launcher, 'MeshtasticInterface', return_value=mock_interface), \
              patch.object(launcher, 'load_config', return_value={"gateway": {"rns_configdir": "/custom/path"}}), \
@@ -84,14 +118,11 @@ class TestStartGateway:
 
             mock_rns.Reticulum.assert_called_once_with(configdir="/custom/path")
 
-    def test_start_gateway_default_configdir_is_none(self):
+    def test_start_gateway_default_configdir_is_none(self, launcher_env):
         """When rns_configdir is not in config, it should default to None."""
-        launcher, mock_rns = _import_launcher()
+        launcher, mock_rns = launcher_env
 
-        mock_interface = MagicMock()
-        mock_interface.online = True
-        mock_interface.interface = MagicMock()
-        mock_interface.name = "TestRadio"
+        mock_interface = _FakeInterface()
 
         with patch.object(launcher, 'MeshtasticInterface', return_value=mock_interface), \
              patch.object(launcher, 'load_config', return_value={"gateway": {}}), \
@@ -104,14 +135,11 @@ class TestStartGateway:
 
             mock_rns.Reticulum.assert_called_once_with(configdir=None)
 
-    def test_start_gateway_detaches_on_keyboard_interrupt(self):
+    def test_start_gateway_detaches_on_keyboard_interrupt(self, launcher_env):
         """start_gateway should call detach() on KeyboardInterrupt."""
-        launcher, mock_rns = _import_launcher()
+        launcher, mock_rns = launcher_env
 
-        mock_interface = MagicMock()
-        mock_interface.online = True
-        mock_interface.interface = MagicMock()
-        mock_interface.name = "TestRadio"
+        mock_interface = _FakeInterface()
 
         stop_event = threading.Event()
 
@@ -129,16 +157,13 @@ class TestStartGateway:
             with pytest.raises(SystemExit):
                 launcher.start_gateway()
 
-            mock_interface.detach.assert_called_once()
+            assert mock_interface.detach_count == 1
 
-    def test_health_check_detects_lost_interface(self):
+    def test_health_check_detects_lost_interface(self, launcher_env):
         """Health check should mark interface offline when health_check() returns False."""
-        launcher, mock_rns = _import_launcher()
+        launcher, mock_rns = launcher_env
 
-        mock_interface = MagicMock()
-        mock_interface.online = True
-        mock_interface.health_check.return_value = False  # Health check fails
-        mock_interface.name = "TestRadio"
+        mock_interface = _FakeInterface(healthy=False)  # Health check fails
 
         call_count = 0
         stop_event = threading.Event()
@@ -166,48 +191,71 @@ class TestStartGateway:
             # After health_check() returns False, online should be set to False
             assert mock_interface.online is False
 
+    def test_online_loop_sleeps_one_probe_interval(self, launcher_env):
+        """While online, the loop blocks on the stop event for a full probe cycle."""
+        launcher, _ = launcher_env
+
+        mock_interface = _FakeInterface()
+
+        stop_event = threading.Event()
+        timeouts = []
+
+        def recording_wait(timeout=None):
+            timeouts.append(timeout)
+            stop_event.set()
+            return True
+
+        stop_event.wait = recording_wait
+
+        with patch.object(launcher, 'MeshtasticInterface', return_value=mock_interface), \
+             patch.object(launcher, 'load_config', return_value={"gateway": {}}), \
+             patch.object(launcher, 'setup_logging'), \
+             patch.object(launcher, '_stop_event', stop_event):
+
+            with pytest.raises(SystemExit):
+                launcher.start_gateway()
+
+        assert timeouts == [launcher.HEALTH_CHECK_INTERVAL]
+
 
 class TestStopEvent:
-    def test_stop_event_exists(self):
+    def test_stop_event_exists(self, launcher_env):
         """Module should have a threading.Event for clean shutdown."""
-        launcher, _ = _import_launcher()
+        launcher, _ = launcher_env
         assert isinstance(launcher._stop_event, threading.Event)
 
-    def test_stop_event_not_set_initially(self):
+    def test_stop_event_not_set_initially(self, launcher_env):
         """Stop event should not be set on import."""
-        launcher, _ = _import_launcher()
+        launcher, _ = launcher_env
         assert not launcher._stop_event.is_set()
 
 
 class TestParseArgs:
-    def test_default_no_debug(self):
+    def test_default_no_debug(self, launcher_env):
         """With no args, debug should be False."""
-        launcher, _ = _import_launcher()
+        launcher, _ = launcher_env
         args = launcher._parse_args([])
         assert args.debug is False
 
-    def test_debug_flag(self):
+    def test_debug_flag(self, launcher_env):
         """--debug should set debug=True."""
-        launcher, _ = _import_launcher()
+        launcher, _ = launcher_env
         args = launcher._parse_args(['--debug'])
         assert args.debug is True
 
-    def test_version_flag(self):
+    def test_version_flag(self, launcher_env):
         """--version should cause SystemExit."""
-        launcher, _ = _import_launcher()
+        launcher, _ = launcher_env
         with pytest.raises(SystemExit):
             launcher._parse_args(['--version'])
 
 
 class TestStartGatewayDebug:
-    def test_debug_sets_log_level(self):
+    def test_debug_sets_log_level(self, launcher_env):
         """start_gateway(debug=True) should call setup_logging with DEBUG level."""
-        launcher, mock_rns = _import_launcher()
+        launcher, mock_rns = launcher_env
 
-        mock_interface = MagicMock()
-        mock_interface.online = True
-        mock_interface.interface = MagicMock()
-        mock_interface.name = "TestRadio"
+        mock_interface = _FakeInterface()
 
         import logging as _logging
         captured_calls = []
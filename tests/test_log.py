@@ -1,10 +1,13 @@
 """Tests for src/utils/log.py — logging configuration and JSON formatter."""
 import json
 import logging
+import logging.handlers
 import os
 import sys
 from unittest.mock import patch
 
+import pytest
+
 from src.utils.log import JsonFormatter, default_log_dir, default_log_path, install_crash_handler
 
 
@@ -73,19 +76,205 @@ class TestJsonFormatter:
         parsed = json.loads(output)
         assert '"quotes"' in parsed["msg"]
 
+    def test_matches_json_dumps(self):
+        """Hand-assembled line decodes to the same object json.dumps would emit."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name='odd "name"', level=logging.INFO, pathname="test.py",
+            lineno=1, msg="café — \\ tab\there", args=(), exc_info=None,
+        )
+        output = formatter.format(record)
+        assert output.isascii()
+        assert list(json.loads(output)) == ["ts", "level", "logger", "msg"]
+        assert json.loads(output)["msg"] == "café — \\ tab\there"
+        assert json.loads(output)["logger"] == 'odd "name"'
+
+    def test_timestamp_reused_within_second(self):
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="test.py",
+            lineno=1, msg="x", args=(), exc_info=None,
+        )
+        record.created = 1736942400.1
+        first = json.loads(formatter.format(record))["ts"]
+        record.created = 1736942400.9
+        assert json.loads(formatter.format(record))["ts"] == first == "2025-01-15T12:00:00Z"
+        record.created = 1736942401.0
+        assert json.loads(formatter.format(record))["ts"] == "2025-01-15T12:00:01Z"
+
 
 class TestSetupLogging:
-    def test_idempotent(self):
+    @pytest.fixture(autouse=True)
+    def _isolated_root(self):
+        """Restore root logger and module state after each setup_logging call."""
+        import src.utils.log as log_module
+        root = logging.getLogger()
+        before = list(root.handlers)
+        original_level = root.level
+        original = log_module._configured
+        log_module._configured = False
+        yield log_module
+        log_module._stop_listener()
+        log_module._configured = original
+        root.setLevel(original_level)
+        for h in list(root.handlers):
+            if h not in before:
+                root.removeHandler(h)
+
+    def test_idempotent(self, _isolated_root):
         """setup_logging should only configure once."""
+        log_module = _isolated_root
+        log_module.setup_logging()
+        log_module.setup_logging()  # Should be no-op
+
+    def test_no_duplicate_handlers_across_module_copies(self, _isolated_root):
+        """A second module copy (fresh _configured flag) must not re-add handlers."""
+        log_module = _isolated_root
+        log_module.setup_logging()
+        log_module._configured = False  # simulate import under another name
+        log_module.setup_logging()
+        tagged = [h for h in logging.getLogger().handlers
+                  if getattr(h, log_module._HANDLER_TAG, None) == "queue"]
+        assert len(tagged) == 1
+
+    def test_records_written_by_listener(self, _isolated_root, tmp_path):
+        """Root gets only a QueueHandler; the listener writes the file."""
+        log_module = _isolated_root
+        root = logging.getLogger()
+        before = list(root.handlers)
+        log_file = str(tmp_path / "logs" / "gateway.log")
+        log_module.setup_logging(log_file=log_file, console_level=logging.CRITICAL)
+        added = [h for h in root.handlers if h not in before]
+        assert len(added) == 1
+        assert isinstance(added[0], logging.handlers.QueueHandler)
+        logging.getLogger("test.queue").info("queued %s", "record")
+        log_module._stop_listener()  # drains the queue
+        with open(log_file) as f:
+            assert "queued record" in f.read()
+
+
+class TestLogFileFallback:
+    def test_writable_path_kept(self, tmp_path):
+        from src.utils.log import _is_writable_log
+        assert _is_writable_log(str(tmp_path / "logs" / "gateway.log")) is True
+
+    def test_unwritable_dir_detected_without_open(self, tmp_path):
+        from src.utils.log import _is_writable_log
+        target = str(tmp_path / "gateway.log")
+        with patch("src.utils.log.os.access", return_value=False), \
+             patch("builtins.open") as mock_open_call:
+            assert _is_writable_log(target) is False
+        mock_open_call.assert_not_called()
+
+    def test_setup_falls_back_to_user_log(self, tmp_path):
         import src.utils.log as log_module
-        # Reset the flag for testing
+        root = logging.getLogger()
+        before = list(root.handlers)
+        original_level = root.level
         original = log_module._configured
+        fallback = str(tmp_path / "gateway.log")
         log_module._configured = False
         try:
-            log_module.setup_logging()
-            log_module.setup_logging()  # Should be no-op
+            with patch("src.utils.log._is_writable_log",
+                       side_effect=lambda p: p == fallback), \
+                 patch("src.utils.log.default_log_path", return_value=fallback):
+                log_module.setup_logging(log_file="/var/log/rns-gateway.log",
+                                         console_level=logging.CRITICAL)
+            handlers = log_module._listener.handlers
+            assert [h.baseFilename for h in handlers
+                    if isinstance(h, logging.FileHandler)] == [fallback]
         finally:
+            log_module._stop_listener()
             log_module._configured = original
+            root.setLevel(original_level)
+            for h in list(root.handlers):
+                if h not in before:
+                    root.removeHandler(h)
+
+
+class TestBufferedRotatingFileHandler:
+    def _handler(self, path, **kwargs):
+        from src.utils.log import _BufferedRotatingFileHandler
+        handler = _BufferedRotatingFileHandler(str(path), **kwargs)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def _record(self, msg, level=logging.INFO):
+        return logging.LogRecord("test", level, "test.py", 1, msg, (), None)
+
+    def test_info_stays_buffered(self, tmp_path):
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=1_000_000, backupCount=1)
+        try:
+            handler.handle(self._record("quiet line"))
+            assert path.read_text() == ""
+        finally:
+            handler.close()
+        assert path.read_text() == "quiet line\n"
+
+    def test_warning_flushes_immediately(self, tmp_path):
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=1_000_000, backupCount=1)
+        try:
+            handler.handle(self._record("first"))
+            handler.handle(self._record("uh oh", logging.WARNING))
+            assert path.read_text() == "first\nuh oh\n"
+        finally:
+            handler.close()
+
+    def test_delay_defers_open_until_first_record(self, tmp_path):
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=1_000_000, backupCount=1, delay=True)
+        try:
+            assert handler.stream is None
+            assert not path.exists()
+            handler.handle(self._record("first", logging.WARNING))
+            assert path.read_text() == "first\n"
+        finally:
+            handler.close()
+
+    def test_rollover_uses_tracked_size(self, tmp_path):
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=50, backupCount=1)
+        try:
+            for _ in range(6):
+                handler.handle(self._record("x" * 19))  # 20 bytes per line
+        finally:
+            handler.close()
+        assert os.path.isfile(str(path) + ".1")
+        assert os.path.getsize(path) <= 50
+
+    def test_size_counts_encoded_bytes(self, tmp_path):
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=1_000_000, backupCount=1,
+                                encoding="utf-8")
+        try:
+            handler.handle(self._record("nöde 📡"))
+            assert handler._size == len("nöde 📡\n".encode("utf-8"))
+        finally:
+            handler.close()
+        assert os.path.getsize(path) == len("nöde 📡\n".encode("utf-8"))
+
+    def test_flush_resyncs_with_other_writers(self, tmp_path):
+        """Appends by another process are picked up at the next real flush."""
+        path = tmp_path / "gateway.log"
+        handler = self._handler(path, maxBytes=1_000_000, backupCount=1)
+        try:
+            handler.handle(self._record("ours"))
+            with open(path, "a") as other:
+                other.write("x" * 99 + "\n")
+            handler.handle(self._record("flush", logging.WARNING))
+            assert handler._size == os.path.getsize(path) == 5 + 100 + 6
+        finally:
+            handler.close()
+
+    @pytest.mark.skipif(os.name == "nt", reason="needs a POSIX character device")
+    def test_never_rolls_over_non_regular_file(self):
+        handler = self._handler(os.devnull, maxBytes=1, backupCount=1)
+        try:
+            assert handler.shouldRollover(self._record("x" * 10)) is False
+        finally:
+            handler.close()
 
 
 class TestDefaultLogDir:
@@ -103,11 +292,27 @@ class TestDefaultLogDir:
     def test_directory_is_created(self, tmp_path):
         """default_log_dir should create the directory if missing."""
         fake_home = str(tmp_path / "fakehome")
-        with patch("src.utils.common.get_real_user_home", return_value=fake_home):
-            result = default_log_dir()
+        default_log_dir.cache_clear()
+        try:
+            with patch("src.utils.common.get_real_user_home", return_value=fake_home):
+                result = default_log_dir()
+        finally:
+            default_log_dir.cache_clear()
         assert os.path.isdir(result)
+        assert result.startswith(fake_home)
         assert "rns-gateway" in result
 
+    def test_resolved_once(self):
+        """The home lookup and makedirs happen once per process."""
+        default_log_dir.cache_clear()
+        try:
+            with patch("src.utils.common.get_real_user_home",
+                       return_value=os.path.expanduser("~")) as mock_home:
+                assert default_log_dir() is default_log_dir()
+            mock_home.assert_called_once()
+        finally:
+            default_log_dir.cache_clear()
+
 
 class TestDefaultLogPath:
     def test_returns_gateway_log(self):
@@ -123,15 +328,36 @@ class TestDefaultLogPath:
 
 
 class TestInstallCrashHandler:
-    def test_installs_excepthook(self):
+    def test_installs_excepthook(self, tmp_path):
         """install_crash_handler should replace sys.excepthook."""
         original_hook = sys.excepthook
         try:
-            install_crash_handler()
+            with patch("src.utils.log.default_log_dir", return_value=str(tmp_path)):
+                install_crash_handler()
             assert sys.excepthook is not sys.__excepthook__
         finally:
             sys.excepthook = original_hook
 
+    def test_installed_hook_appends_report(self, tmp_path):
+        """The installed hook writes one report per crash and chains to the default hook."""
+        original_hook = sys.excepthook
+        try:
+            with patch("src.utils.log.default_log_dir", return_value=str(tmp_path)):
+                install_crash_handler()
+            try:
+                raise RuntimeError("test crash")
+            except RuntimeError:
+                exc_info = sys.exc_info()
+            with patch("sys.__excepthook__") as mock_default:
+                sys.excepthook(*exc_info)
+                sys.excepthook(*exc_info)
+            assert mock_default.call_count == 2
+        finally:
+            sys.excepthook = original_hook
+        content = (tmp_path / "crash.log").read_text()
+        assert content.count("RuntimeError: test crash") == 2
+        assert content.startswith("\n--- ")
+
     def test_crash_handler_writes_to_file(self, tmp_path):
         """The crash handler should write exception info to the crash log."""
         crash_log = str(tmp_path / "crash.log")
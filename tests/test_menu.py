@@ -5,10 +5,6 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
 from src.ui.menu import get_editor, get_python, clear_screen, launch_detached, _parse_args, _StatusCache, _flush_input
 
 
@@ -40,6 +36,13 @@ class TestFlushInput:
 
 
 class TestGetEditor:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        """get_editor is memoized; each test patches env/PATH and needs a fresh lookup."""
+        get_editor.cache_clear()
+        yield
+        get_editor.cache_clear()
+
     def test_returns_string(self):
         """get_editor should always return a non-empty string."""
         editor = get_editor()
@@ -66,6 +69,12 @@ class TestGetEditor:
              patch('shutil.which', return_value=None):
             assert get_editor() == 'notepad'
 
+    def test_path_walked_once(self):
+        with patch.dict(os.environ, {'EDITOR': 'nano'}), \
+             patch('shutil.which', return_value='/usr/bin/nano') as mock_which:
+            assert get_editor() == get_editor() == 'nano'
+        mock_which.assert_called_once_with('nano')
+
 
 class TestGetPython:
     def test_returns_executable(self):
@@ -90,10 +99,26 @@ class TestClearScreen:
     def test_does_not_raise_on_nt(self):
         """clear_screen should not raise on Windows (mocked)."""
         with patch('os.name', 'nt'), \
+             patch('src.ui.menu._NT_USE_VT', False), \
              patch('subprocess.run') as mock_run:
             clear_screen()
             mock_run.assert_called_once()
 
+    def test_nt_with_vt_writes_ansi(self):
+        """A VT-capable Windows console is cleared without spawning cmd.exe."""
+        with patch('os.name', 'nt'), \
+             patch('src.ui.menu._NT_USE_VT', True), \
+             patch('subprocess.run') as mock_run, \
+             patch('sys.stdout') as mock_stdout:
+            clear_screen()
+        mock_run.assert_not_called()
+        mock_stdout.write.assert_called_once_with('\033[H\033[2J\033[3J')
+
+    @pytest.mark.skipif(os.name == 'nt', reason="probe result depends on the console")
+    def test_vt_probe_false_off_windows(self):
+        from src.ui.menu import _enable_vt_mode
+        assert _enable_vt_mode() is False
+
 
 class TestLaunchDetached:
     def test_returns_true_on_success(self):
@@ -4,6 +4,7 @@ import base64
 import json
 import sys
 import time
+import types
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,11 +15,13 @@ import pytest
 # We mock it at import time, same pattern as test_launcher.py.
 
 _mock_rns = MagicMock()
-_mock_rns_interface_mod = MagicMock()
+_mock_rns_interface_mod = types.ModuleType('RNS.Interfaces.Interface')
 _mock_rns_interface_mod.Interface = type(
     'Interface', (), {'MODE_ACCESS_POINT': 1},
 )
-_mock_rns.Interfaces.Interface = _mock_rns_interface_mod
+_mock_rns_interfaces = types.ModuleType('RNS.Interfaces')
+_mock_rns_interfaces.Interface = _mock_rns_interface_mod
+_mock_rns.Interfaces = _mock_rns_interfaces
 
 _mock_mqtt_mod = MagicMock()
 _mock_mqtt_client_instance = MagicMock()
@@ -28,7 +31,7 @@ _mock_mqtt_mod.CallbackAPIVersion.VERSION2 = 2
 
 _SYS_MODULE_MOCKS = {
     'RNS': _mock_rns,
-    'RNS.Interfaces': MagicMock(),
+    'RNS.Interfaces': _mock_rns_interfaces,
     'RNS.Interfaces.Interface': _mock_rns_interface_mod,
     'paho': MagicMock(),
     'paho.mqtt': MagicMock(),
@@ -36,9 +39,7 @@ _SYS_MODULE_MOCKS = {
 }
 
 # Clear any cached import of src.mqtt_bridge so it re-imports with mocks
-for _key in list(sys.modules):
-    if _key == 'src.mqtt_bridge':
-        del sys.modules[_key]
+sys.modules.pop('src.mqtt_bridge', None)
 
 # Patch sys.modules BEFORE importing MqttBridge
 _patcher = patch.dict('sys.modules', _SYS_MODULE_MOCKS)
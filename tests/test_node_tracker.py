@@ -155,6 +155,18 @@ class TestGetNodes:
         assert nodes[0]["node_id"] == "!new"
         assert nodes[1]["node_id"] == "!old"
 
+    def test_get_all_limit_returns_most_recent(self, tracker):
+        for i in range(10):
+            tracker.update_node(f"!n{i}")
+            tracker._nodes[f"!n{i}"].last_seen = 1000.0 + i
+        nodes = tracker.get_all_nodes(limit=3)
+        assert [n["node_id"] for n in nodes] == ["!n9", "!n8", "!n7"]
+        assert tracker.node_count == 10
+
+    def test_get_all_limit_larger_than_count(self, tracker):
+        tracker.update_node("!only")
+        assert [n["node_id"] for n in tracker.get_all_nodes(limit=5)] == ["!only"]
+
     def test_get_node_unknown_returns_none(self, tracker):
         assert tracker.get_node("!nonexistent") is None
 
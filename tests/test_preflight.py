@@ -1,14 +1,9 @@
 """Tests for src/ui/preflight.py — startup checks and port conflict detection."""
 import os
-import sys
 from unittest.mock import patch
 
 import pytest
 
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
 from src.ui.preflight import startup_preflight, check_port_conflicts
 
 
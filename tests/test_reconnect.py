@@ -1,6 +1,7 @@
 """Tests for src/utils/reconnect.py — ReconnectStrategy and SlowStartRecovery."""
 import threading
 import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -29,10 +30,43 @@ class TestGetDelay:
     def test_jitter_varies_delay(self):
         """With jitter > 0, repeated calls should produce varying delays."""
         strategy = ReconnectStrategy(initial_delay=10.0, jitter=0.5)
-        delays = [strategy.get_delay(0) for _ in range(50)]
-        # With 50% jitter on 10s, delays range from 5 to 15
-        assert min(delays) < 10.0
-        assert max(delays) > 10.0
+        get_delay, max_delay = strategy.get_delay, strategy.max_delay
+        # The first draw is uniform over [10, 30] (below the cap), so two
+        # equal floats are practically impossible; a handful of samples
+        # proves variation.  Bounds over long walks are covered by
+        # test_decorrelated_jitter_bounded_by_previous.
+        delays = [get_delay() for _ in range(5)]
+        assert len(set(delays)) > 1
+        assert all(10.0 <= d <= max_delay for d in delays)
+
+    def test_beyond_table_matches_formula(self):
+        """Attempts past max_attempts still follow the capped curve."""
+        strategy = ReconnectStrategy(initial_delay=1.0, multiplier=2.0,
+                                     max_delay=1000.0, max_attempts=3, jitter=0.0)
+        assert strategy.get_delay(2) == 4.0
+        assert strategy.get_delay(5) == 32.0
+
+    def test_decorrelated_jitter_bounded_by_previous(self):
+        """Each draw lies in [initial_delay, 3 * previous] and under max_delay."""
+        strategy = ReconnectStrategy(initial_delay=1.0, max_delay=20.0, jitter=0.15)
+        get_delay = strategy.get_delay
+        prev = strategy.initial_delay
+        for _ in range(200):
+            delay = get_delay()
+            assert 1.0 <= delay <= min(20.0, max(1.0, prev * 3))
+            prev = delay
+
+    def test_success_and_reset_restart_jitter_walk(self):
+        strategy = ReconnectStrategy(initial_delay=1.0, max_delay=60.0, jitter=0.15)
+        get_delay = strategy.get_delay
+        for _ in range(20):
+            get_delay()
+        strategy.record_success()
+        assert get_delay() <= 3.0
+        for _ in range(20):
+            get_delay()
+        strategy.reset()
+        assert strategy.get_delay() <= 3.0
 
     def test_default_uses_internal_counter(self):
         """get_delay() with no arg should use the internal attempt counter."""
@@ -95,6 +129,23 @@ class TestWait:
         result = strategy.wait(event, timeout=5.0)
         assert result is False
 
+    def test_zero_delay_skips_event_wait(self):
+        """A zero delay returns immediately without blocking on the event."""
+        event = MagicMock()
+        event.is_set.return_value = False
+        strategy = ReconnectStrategy()
+        assert strategy.wait(event, timeout=0) is True
+        event.wait.assert_not_called()
+
+    def test_zero_delay_still_reports_stop(self):
+        event = threading.Event()
+        event.set()
+        assert ReconnectStrategy().wait(event, timeout=0) is False
+
+    def test_negative_initial_delay_clamped(self):
+        strategy = ReconnectStrategy(initial_delay=-1.0, jitter=0.0)
+        assert strategy.get_delay(0) == 0.0
+
     def test_wait_uses_get_delay_by_default(self):
         """wait() with negative timeout should use get_delay()."""
         event = threading.Event()
@@ -156,6 +207,14 @@ class TestSlowStart:
         delay = strategy.inter_packet_delay()
         assert delay > 0.0
 
+    def test_idle_path_skips_clock(self):
+        """No recovery in progress → no monotonic() read per packet."""
+        strategy = ReconnectStrategy()
+        with patch('src.utils.reconnect.time.monotonic') as mock_clock:
+            assert strategy.inter_packet_delay() == 0.0
+            assert strategy.throughput_factor() == 1.0
+        mock_clock.assert_not_called()
+
     def test_inter_packet_delay_zero_at_full_throughput(self):
         """inter_packet_delay should be 0 when not in slow-start."""
         strategy = ReconnectStrategy()
@@ -1,7 +1,14 @@
 """Tests for src/utils/service_check.py — environment probes."""
-from unittest.mock import patch, MagicMock
+import os
+import socket
+import struct
+import threading
+from unittest.mock import patch, MagicMock, mock_open
+
+import pytest
 
 from src.utils.service_check import (
+    clear_probe_cache,
     check_rns_lib,
     check_meshtastic_lib,
     check_serial_ports,
@@ -12,9 +19,20 @@ from src.utils.service_check import (
     check_tcp_port,
     check_serial_device,
     check_serial_ports_detailed,
+    get_platform_info,
+    run_all_checks,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_probe_cache():
+    """Each test sees un-memoized probes with pgrep/systemctl on PATH."""
+    clear_probe_cache()
+    with patch('src.utils.service_check._which', side_effect=lambda cmd: f"/usr/bin/{cmd}"):
+        yield
+    clear_probe_cache()
+
+
 class TestCheckRnsLib:
     def test_available(self):
         mock_rns = MagicMock(__version__='0.7.4')
@@ -105,6 +123,20 @@ class TestCheckRnsConfig:
             assert ok is False
             assert info == "not found"
 
+    def test_config_is_directory(self, tmp_path):
+        with patch('src.utils.common.RNS_CONFIG_FILE', str(tmp_path)):
+            ok, info = check_rns_config()
+            assert ok is False
+
+    def test_single_stat_call(self, tmp_path):
+        config_file = tmp_path / "config"
+        config_file.write_text("x" * 10)
+        with patch('src.utils.common.RNS_CONFIG_FILE', str(config_file)), \
+             patch('src.utils.service_check.os.stat', wraps=os.stat) as mock_stat:
+            ok, info = check_rns_config()
+        assert (ok, info) == (True, "10 bytes")
+        assert mock_stat.call_count == 1
+
 
 class TestCheckRnsdStatus:
     def test_running(self):
@@ -183,18 +215,79 @@ class TestCheckMeshtasticdStatus:
             assert "pgrep unavailable" in info
 
 
+def _probe_cache_only_clear():
+    """Expire the TTL memo but keep the PID cache."""
+    from src.utils import service_check
+    service_check._probe_cache.clear()
+
+
+class TestPidCache:
+    def test_live_pid_skips_pgrep(self):
+        mock_result = MagicMock(returncode=0, stdout="12345\n")
+        with patch('subprocess.run', return_value=mock_result) as mock_run, \
+             patch('src.utils.service_check._pids_alive', return_value=True):
+            check_rnsd_status()
+            _probe_cache_only_clear()
+            ok, info = check_rnsd_status()
+        assert ok is True
+        assert "12345" in info
+        assert mock_run.call_count == 1
+
+    def test_dead_pid_reprobes(self):
+        mock_result = MagicMock(returncode=1, stdout="")
+        with patch('subprocess.run', return_value=MagicMock(returncode=0, stdout="12345\n")):
+            check_rnsd_status()
+        _probe_cache_only_clear()
+        with patch('subprocess.run', return_value=mock_result) as mock_run, \
+             patch('src.utils.service_check._pids_alive', return_value=False):
+            ok, info = check_rnsd_status()
+        assert ok is False
+        assert mock_run.call_count == 1
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs Linux /proc")
+    def test_pids_alive_checks_comm(self):
+        from src.utils.service_check import _pids_alive
+        me = str(os.getpid())
+        with open(f"/proc/{me}/comm", "rb") as f:
+            comm = f.read().strip().decode()
+        assert _pids_alive(comm, [me]) is True
+        assert _pids_alive("not-" + comm, [me]) is False
+        assert _pids_alive(comm, ["999999999"]) is False
+
+
+class TestMissingTools:
+    """Absent binaries short-circuit without spawning a subprocess."""
+
+    def test_rnsd_pgrep_missing(self):
+        with patch('src.utils.service_check._which', return_value=None), \
+             patch('subprocess.run') as mock_run:
+            ok, info = check_rnsd_status()
+        assert ok is False
+        assert "pgrep unavailable" in info
+        mock_run.assert_not_called()
+
+    def test_meshtasticd_skips_missing_systemctl(self):
+        def which(cmd):
+            return None if cmd == 'systemctl' else f"/usr/bin/{cmd}"
+
+        with patch('src.utils.service_check._which', side_effect=which), \
+             patch('subprocess.run', return_value=MagicMock(returncode=0, stdout="42\n")) as mock_run:
+            ok, info = check_meshtasticd_status()
+        assert ok is True
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][0] == 'pgrep'
+
+
 class TestCheckRnsUdpPort:
     def test_port_in_use_via_proc(self):
         """Passive /proc/net/udp scan detects port in use."""
         # Port 37428 = 0x9234
         proc_content = (
-            "  sl  local_address rem_address   st\n"
-            "   0: 00000000:9234 00000000:0000 07\n"
+            b"  sl  local_address rem_address   st\n"
+            b"   0: 00000000:9234 00000000:0000 07\n"
         )
         with patch('os.path.isfile', return_value=True), \
-             patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__ = lambda s: iter(proc_content.splitlines())
-            mock_open.return_value.__exit__ = MagicMock(return_value=False)
+             patch('builtins.open', mock_open(read_data=proc_content)):
             ok, info = check_rns_udp_port()
             assert ok is True
             assert "in use" in info
@@ -202,17 +295,26 @@ class TestCheckRnsUdpPort:
     def test_port_not_in_use_via_proc(self):
         """Passive /proc/net/udp scan shows port not in use."""
         proc_content = (
-            "  sl  local_address rem_address   st\n"
-            "   0: 00000000:1234 00000000:0000 07\n"
+            b"  sl  local_address rem_address   st\n"
+            b"   0: 00000000:1234 00000000:0000 07\n"
         )
         with patch('os.path.isfile', return_value=True), \
-             patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__ = lambda s: iter(proc_content.splitlines())
-            mock_open.return_value.__exit__ = MagicMock(return_value=False)
+             patch('builtins.open', mock_open(read_data=proc_content)):
             ok, info = check_rns_udp_port()
             assert ok is False
             assert "not in use" in info
 
+    def test_remote_port_match_is_ignored(self):
+        """Port appearing only in the rem_address column is not 'in use'."""
+        proc_content = (
+            b"  sl  local_address rem_address   st\n"
+            b"   0: 0100007F:1234 0100007F:9234 01\n"
+        )
+        with patch('os.path.isfile', return_value=True), \
+             patch('builtins.open', mock_open(read_data=proc_content)):
+            ok, info = check_rns_udp_port()
+            assert ok is False
+
     def test_fallback_socket_probe_port_in_use(self):
         """Socket probe fallback when /proc/net/udp is unavailable."""
         with patch('os.path.isfile', return_value=False), \
@@ -235,40 +337,86 @@ class TestCheckRnsUdpPort:
             assert "not in use" in info
 
 
+class TestProbeCache:
+    def test_repeated_call_within_ttl_reuses_result(self):
+        mock_result = MagicMock(returncode=0, stdout="12345\n")
+        with patch('subprocess.run', return_value=mock_result) as mock_run:
+            first = check_rnsd_status()
+            second = check_rnsd_status()
+        assert first == second
+        assert mock_run.call_count == 1
+
+    def test_expired_entry_is_reprobed(self):
+        mock_result = MagicMock(returncode=0, stdout="12345\n")
+        with patch('subprocess.run', return_value=mock_result) as mock_run, \
+             patch('src.utils.service_check.time.monotonic', side_effect=[100.0, 102.0]):
+            check_rnsd_status()
+            check_rnsd_status()
+        assert mock_run.call_count == 2
+
+    def test_cache_keyed_by_port(self):
+        with patch('os.path.isfile', return_value=False), \
+             patch('socket.socket') as mock_sock_cls:
+            check_rns_udp_port(37428)
+            check_rns_udp_port(4242)
+        assert mock_sock_cls.call_count == 2
+
+
 class TestCheckTcpPort:
     def test_port_listening(self):
         """TCP port accepting connections."""
-        with patch('src.utils.service_check.socket.socket') as mock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect_ex.return_value = 0
-            mock_cls.return_value.__enter__ = lambda s: mock_sock
-            mock_cls.return_value.__exit__ = MagicMock(return_value=False)
+        with patch('src.utils.service_check.socket.create_connection') as mock_conn:
             ok, info = check_tcp_port(4403)
             assert ok is True
             assert "listening" in info
+            mock_conn.return_value.__exit__.assert_called_once()
+
+    def test_listening_probe_closes_with_rst(self):
+        """SO_LINGER {1, 0} so closing the probe doesn't leave TIME_WAIT."""
+        with patch('src.utils.service_check.socket.create_connection') as mock_conn:
+            check_tcp_port(4403)
+        sock = mock_conn.return_value.__enter__.return_value
+        sock.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
 
     def test_port_not_listening(self):
         """TCP port not accepting connections."""
-        with patch('src.utils.service_check.socket.socket') as mock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect_ex.return_value = 111  # ECONNREFUSED
-            mock_cls.return_value.__enter__ = lambda s: mock_sock
-            mock_cls.return_value.__exit__ = MagicMock(return_value=False)
+        with patch('src.utils.service_check.socket.create_connection',
+                   side_effect=ConnectionRefusedError(111, "refused")):
+            ok, info = check_tcp_port(4403)
+            assert ok is False
+            assert "not listening" in info
+
+    def test_port_timeout_is_not_listening(self):
+        with patch('src.utils.service_check.socket.create_connection',
+                   side_effect=socket.timeout("timed out")):
             ok, info = check_tcp_port(4403)
             assert ok is False
             assert "not listening" in info
 
     def test_port_check_error(self):
         """TCP port check raises OSError."""
-        with patch('src.utils.service_check.socket.socket') as mock_cls:
-            mock_cls.return_value.__enter__ = MagicMock(
-                side_effect=OSError("network error")
-            )
-            mock_cls.return_value.__exit__ = MagicMock(return_value=False)
+        with patch('src.utils.service_check.socket.create_connection',
+                   side_effect=OSError("network error")):
             ok, info = check_tcp_port(4403)
             assert ok is False
             assert "failed" in info
 
+    def test_loopback_uses_short_timeout(self):
+        from src.utils.timeouts import TCP_PREFLIGHT, TCP_PREFLIGHT_LOCAL
+        with patch('src.utils.service_check.socket.create_connection') as mock_conn:
+            check_tcp_port(4403)
+            check_tcp_port(4403, "192.0.2.10")
+        timeouts = [c.kwargs["timeout"] for c in mock_conn.call_args_list]
+        assert timeouts == [TCP_PREFLIGHT_LOCAL, TCP_PREFLIGHT]
+
+    def test_result_memoized_per_host_port(self):
+        with patch('src.utils.service_check.socket.create_connection') as mock_conn:
+            check_tcp_port(4403)
+            check_tcp_port(4403)
+            check_tcp_port(5000)
+        assert mock_conn.call_count == 2
+
 
 class TestCheckSerialDevice:
     def test_device_exists(self, tmp_path):
@@ -298,3 +446,63 @@ class TestCheckSerialPortsDetailed:
         }):
             result = check_serial_ports_detailed()
             assert isinstance(result, list)
+
+
+class TestGetPlatformInfo:
+    def test_has_expected_keys(self):
+        info = get_platform_info()
+        assert set(info) == {"system", "release", "hostname", "python"}
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX uname path")
+    def test_uname_queried_once(self):
+        fake = os.uname_result(("Linux", "gw-pi", "6.1.0-rpi7", "#1", "aarch64"))
+        get_platform_info.cache_clear()
+        try:
+            with patch('src.utils.service_check.os.uname', return_value=fake) as mock_uname:
+                first = get_platform_info()
+                second = get_platform_info()
+            mock_uname.assert_called_once()
+            assert first is second
+            assert first["system"] == "Linux"
+            assert first["release"] == "6.1.0-rpi7"
+            assert first["hostname"] == "gw-pi"
+        finally:
+            get_platform_info.cache_clear()
+
+
+class TestRunAllChecks:
+    def test_returns_result_per_name(self):
+        results = run_all_checks({
+            "a": lambda: (True, "one"),
+            "b": lambda: (False, "two"),
+        })
+        assert results == {"a": (True, "one"), "b": (False, "two")}
+
+    def test_probes_run_concurrently(self):
+        """Two probes that each wait for the other only finish if run in parallel."""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def probe():
+            barrier.wait()
+            return True, "ok"
+
+        results = run_all_checks({"x": probe, "y": probe})
+        assert results == {"x": (True, "ok"), "y": (True, "ok")}
+
+    def test_probe_exception_propagates(self):
+        def boom():
+            raise RuntimeError("probe failed")
+
+        with pytest.raises(RuntimeError):
+            run_all_checks({"boom": boom})
+
+    def test_default_set_covers_dashboard_panels(self):
+        with patch('src.utils.service_check.subprocess.run',
+                   return_value=MagicMock(returncode=1, stdout="")), \
+             patch('os.path.isfile', return_value=False), \
+             patch('socket.socket'):
+            results = run_all_checks()
+        assert set(results) == {
+            "rns_lib", "meshtastic_lib", "serial_ports", "rns_config",
+            "rnsd", "meshtasticd", "rns_udp",
+        }
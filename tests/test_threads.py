@@ -62,3 +62,91 @@ class TestThreadManager:
         stop.set()
         time.sleep(0.1)
         assert "x" not in mgr.running_threads
+
+    def test_shutdown_timeout_is_total_not_per_thread(self):
+        mgr = ThreadManager()
+        release = threading.Event()
+        for name in ("s1", "s2", "s3"):
+            mgr.start_thread(name, release.wait)  # ignores its stop event
+        try:
+            t0 = time.monotonic()
+            still = mgr.shutdown(timeout=0.3)
+            elapsed = time.monotonic() - t0
+            assert still == 3
+            assert elapsed < 0.6  # serial per-thread joins would take ~0.9s
+        finally:
+            release.set()
+            mgr.shutdown(timeout=2)
+
+    def test_running_threads_not_blocked_during_shutdown(self):
+        mgr = ThreadManager()
+        release = threading.Event()
+        mgr.start_thread("slow", release.wait)
+        shutter = threading.Thread(target=mgr.shutdown, kwargs={"timeout": 2})
+        shutter.start()
+        try:
+            time.sleep(0.05)  # shutdown() is now joining "slow"
+            t0 = time.monotonic()
+            assert "slow" in mgr.running_threads
+            assert time.monotonic() - t0 < 0.5
+        finally:
+            release.set()
+            shutter.join()
+        assert mgr.running_threads == []
+
+    def test_stop_thread_does_not_hold_lock_while_joining(self):
+        mgr = ThreadManager()
+        release = threading.Event()
+        mgr.start_thread("slow", release.wait)
+        stopper = threading.Thread(target=mgr.stop_thread, args=("slow",),
+                                   kwargs={"timeout": 2})
+        stopper.start()
+        try:
+            time.sleep(0.05)  # stop_thread() is now joining "slow"
+            t0 = time.monotonic()
+            mgr.start_thread("other", _quick_worker)
+            assert time.monotonic() - t0 < 0.5
+        finally:
+            release.set()
+            stopper.join()
+        assert "slow" not in mgr.running_threads
+
+    def test_restart_during_join_keeps_new_stop_event(self):
+        """A same-name thread started while stop_thread() joins stays stoppable."""
+        mgr = ThreadManager()
+        old_stop = threading.Event()
+        gate = threading.Event()
+
+        def slow_exit():
+            old_stop.wait()
+            gate.wait()
+
+        mgr.start_thread("w", slow_exit, stop_event=old_stop)
+        stopper = threading.Thread(target=mgr.stop_thread, args=("w",),
+                                   kwargs={"timeout": 2})
+        stopper.start()
+        new_stop = threading.Event()
+        output = []
+        try:
+            assert old_stop.wait(1)  # stop_thread() is now joining the old "w"
+            mgr.start_thread("w", _dummy_worker, args=(new_stop, output),
+                             stop_event=new_stop)
+        finally:
+            gate.set()
+            stopper.join()
+        try:
+            assert mgr.stop_thread("w", timeout=2)
+            assert output == ["stopped"]
+        finally:
+            new_stop.set()  # never leave a non-daemon worker behind
+
+    def test_stop_thread_timeout_keeps_thread_registered(self):
+        mgr = ThreadManager()
+        release = threading.Event()
+        mgr.start_thread("stuck", release.wait)
+        try:
+            assert mgr.stop_thread("stuck", timeout=0.05) is False
+            assert "stuck" in mgr.running_threads
+        finally:
+            release.set()
+            mgr.shutdown(timeout=2)
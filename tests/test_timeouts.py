@@ -18,6 +18,7 @@ from src.utils.timeouts import (
     THREAD_JOIN_LONG,
     TX_QUEUE_MAXSIZE,
     TX_QUEUE_POLL,
+    TX_QUEUE_BATCH,
     DASHBOARD_REFRESH,
 )
 
@@ -76,6 +77,9 @@ class TestTimeoutConstants:
     def test_tx_queue_poll_positive(self):
         assert TX_QUEUE_POLL > 0
 
+    def test_tx_queue_batch_positive(self):
+        assert TX_QUEUE_BATCH >= 1
+
     def test_dashboard_refresh_positive(self):
         assert DASHBOARD_REFRESH > 0
 
@@ -1,6 +1,7 @@
 """Tests for src/utils/tx_queue.py — bounded transmit queue."""
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -21,6 +22,22 @@ class TestEnqueue:
         assert q.enqueue(b'\x03') is False  # Full
         assert q.dropped == 1
 
+    def test_dropped_counted_across_threads(self):
+        q = TxQueue(send_fn=lambda d: None, maxsize=1)
+        q.enqueue(b'\x00')
+
+        def flood():
+            for _ in range(500):
+                q.enqueue(b'\x01')
+
+        threads = [threading.Thread(target=flood) for _ in range(4)]
+        with patch('src.utils.tx_queue.log'):
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert q.dropped == 2000
+
     def test_pending_count(self):
         sent = []
         q = TxQueue(send_fn=sent.append, maxsize=10)
@@ -61,6 +78,78 @@ class TestDrain:
         assert q.pending == 0
 
 
+class TestBatchDrain:
+    def test_burst_sent_as_one_batch(self):
+        batches = []
+        q = TxQueue(send_fn=lambda d: None, maxsize=10, send_batch_fn=batches.append)
+        for i in range(5):
+            q.enqueue(bytes([i]))
+        q.start()
+        time.sleep(0.2)
+        q.stop()
+        assert batches == [[b'\x00', b'\x01', b'\x02', b'\x03', b'\x04']]
+
+    def test_batch_size_caps_each_batch(self):
+        batches = []
+        q = TxQueue(send_fn=lambda d: None, maxsize=10,
+                    send_batch_fn=batches.append, batch_size=2)
+        for i in range(5):
+            q.enqueue(bytes([i]))
+        q.start()
+        time.sleep(0.2)
+        q.stop()
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_delay_applied_once_per_batch(self):
+        delay_calls = []
+
+        def delay_fn():
+            delay_calls.append(1)
+            return 0.0
+
+        q = TxQueue(send_fn=lambda d: None, maxsize=10, inter_packet_delay_fn=delay_fn,
+                    send_batch_fn=lambda batch: None)
+        for i in range(4):
+            q.enqueue(bytes([i]))
+        q.start()
+        time.sleep(0.2)
+        q.stop()
+        assert len(delay_calls) == 1
+
+    def test_batch_failure_reported_per_packet(self):
+        failures = []
+
+        def bad_batch(batch):
+            raise OSError("radio disconnected")
+
+        q = TxQueue(send_fn=lambda d: None, maxsize=10, send_batch_fn=bad_batch,
+                    on_send_failure=lambda data, e: failures.append(data))
+        q.enqueue(b'\x01')
+        q.enqueue(b'\x02')
+        q.start()
+        time.sleep(0.2)
+        q.stop()
+        assert failures == [b'\x01', b'\x02']
+
+    def test_per_packet_send_still_paced(self):
+        """Without send_batch_fn every packet still gets its own delay."""
+        delay_calls = []
+        sent = []
+
+        def delay_fn():
+            delay_calls.append(1)
+            return 0.0
+
+        q = TxQueue(send_fn=sent.append, maxsize=10, inter_packet_delay_fn=delay_fn)
+        for i in range(3):
+            q.enqueue(bytes([i]))
+        q.start()
+        time.sleep(0.2)
+        q.stop()
+        assert sent == [b'\x00', b'\x01', b'\x02']
+        assert len(delay_calls) == 3
+
+
 class TestInterPacketDelay:
     def test_delay_fn_is_called(self):
         sent = []
@@ -86,6 +175,56 @@ class TestStartStop:
         q.start()  # Should not create a second thread
         q.stop()
 
+    def test_stop_wakes_idle_drain_thread(self):
+        """stop() notifies the drain thread instead of waiting out the poll."""
+        q = TxQueue(send_fn=lambda d: None, maxsize=10)
+        q.start()
+        time.sleep(0.05)  # let the drain thread block on the empty queue
+        t0 = time.monotonic()
+        q.stop()
+        assert time.monotonic() - t0 < 0.25
+
+    def test_enqueue_wakes_drain_thread(self):
+        sent = threading.Event()
+        q = TxQueue(send_fn=lambda d: sent.set(), maxsize=10)
+        q.start()
+        try:
+            time.sleep(0.05)
+            q.enqueue(b'\x01')
+            assert sent.wait(0.25)
+        finally:
+            q.stop()
+
+    def test_stop_mid_batch_requeues_unsent(self):
+        """stop() during a paced batch ends the drain thread and loses nothing."""
+        sent = []
+        first_sent = threading.Event()
+        delay = [0.3]
+
+        def send(data):
+            sent.append(data)
+            first_sent.set()
+
+        q = TxQueue(send_fn=send, maxsize=10, inter_packet_delay_fn=lambda: delay[0])
+        for i in range(5):
+            q.enqueue(bytes([i]))
+        q.start()
+        drain = q._thread
+        assert first_sent.wait(1.0)
+        q.stop()
+        assert not drain.is_alive()
+        assert len(sent) + q.pending == 5
+
+        delay[0] = 0.0
+        q.start()
+        try:
+            deadline = time.monotonic() + 1.0
+            while len(sent) < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            q.stop()
+        assert sent == [bytes([i]) for i in range(5)]
+
     def test_stop_without_start_is_safe(self):
         q = TxQueue(send_fn=lambda d: None, maxsize=10)
         q.stop()  # Should not raise
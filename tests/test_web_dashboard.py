@@ -1,20 +1,19 @@
 """Tests for src/monitoring/web_dashboard.py — Flask dashboard routes."""
-import os
-import sys
 import time
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+# Flask is an optional dependency; skip the module cleanly without it.
+pytest.importorskip("flask")
+
+from src.monitoring import web_dashboard  # noqa: E402
 
 
 @pytest.fixture
 def flask_client():
     """Create a Flask test client for the web dashboard."""
-    from src.monitoring.web_dashboard import app
+    app = web_dashboard.app
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
@@ -149,20 +148,17 @@ class TestApiRateLimiting:
 
     @pytest.fixture(autouse=True)
     def _reset_buckets(self):
-        from src.monitoring import web_dashboard
         web_dashboard._reset_rate_limits()
         yield
         web_dashboard._reset_rate_limits()
 
     def test_under_limit_allowed(self, flask_client):
-        from src.monitoring import web_dashboard
         web_dashboard._bridge_health_ref = None  # 503 path is fine
         for _ in range(5):
             r = flask_client.get('/api/health')
             assert r.status_code in (200, 503)
 
     def test_over_limit_returns_429(self, flask_client):
-        from src.monitoring import web_dashboard
         # The decorator captured RATE_LIMIT_MAX_REQUESTS at import time, so
         # seed the bucket with that many timestamps to simulate exhaustion.
         ip = "127.0.0.1"
@@ -178,7 +174,6 @@ class TestApiRateLimiting:
         assert "Retry-After" in r.headers
 
     def test_per_endpoint_buckets_are_independent(self, flask_client):
-        from src.monitoring import web_dashboard
         ip = "127.0.0.1"
         # Saturate /api/health bucket only.
         with web_dashboard._rate_lock: